@@ -0,0 +1,218 @@
+# boxing/backends.py
+"""Engine backends behind one protocol, picked by name (e.g. `--engine outcome`).
+
+Every backend returns at least
+
+    {"winner": name | None, "scores": {name: pts}, "round_points": [(red, blue), ...]}
+
+"reference" also carries MatchEngine's "rounds" telemetry and "events".
+Backends flagged `exact` reproduce the reference winner/scores/round points
+seed for seed; the rest only promise the same distribution. tests/test_backends.py
+checks every registered backend against the reference automatically.
+"""
+from __future__ import annotations
+
+import random
+from itertools import accumulate
+from typing import Dict, Iterable, List, Protocol, Tuple
+
+from boxing.engine import ROUNDS, MatchEngine
+from boxing.kernel import TableMatchEngine
+from boxing.models import Boxer
+from boxing.odds import land_probability
+from boxing.prob import block_score, dodge_score, parry_score
+
+EXCHANGES = 2  # per round, as in MatchEngine._simulate_round
+DEFAULT_ENGINE = "reference"
+
+
+class EngineBackend(Protocol):
+    name: str
+    exact: bool  # matches the reference engine seed for seed
+    telemetry: bool  # result includes per-round "rounds" telemetry and "events"
+
+    def simulate(self, red: Boxer, blue: Boxer, seed: int | None = None) -> dict: ...
+
+    def simulate_many(self, red: Boxer, blue: Boxer, seeds: Iterable[int]) -> List[dict]: ...
+
+
+ENGINES: Dict[str, EngineBackend] = {}
+
+
+def register(backend: EngineBackend) -> EngineBackend:
+    ENGINES[backend.name] = backend
+    return backend
+
+
+def engine_names() -> List[str]:
+    return list(ENGINES)
+
+
+def get_engine(name: str = DEFAULT_ENGINE) -> EngineBackend:
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown engine '{name}'. Available: {', '.join(ENGINES)}") from None
+
+
+def _finish(red: Boxer, blue: Boxer, round_points: List[Tuple[int, int]]) -> dict:
+    r = sum(p for p, _ in round_points)
+    b = sum(p for _, p in round_points)
+    winner = red.name if r > b else blue.name if b > r else None
+    return {"winner": winner, "scores": {red.name: r, blue.name: b}, "round_points": round_points}
+
+
+def _points(red_landed: int, blue_landed: int) -> Tuple[int, int]:
+    if red_landed > blue_landed:
+        return 10, 9
+    if blue_landed > red_landed:
+        return 9, 10
+    return 10, 10
+
+
+# ------------------------------- Reference ------------------------------- #
+class ReferenceBackend:
+    """MatchEngine as-is, plus round_points."""
+
+    name = "reference"
+    exact = True
+    telemetry = True
+
+    def __init__(self, engine: type[MatchEngine] = MatchEngine):
+        self.engine = engine
+
+    def simulate(self, red: Boxer, blue: Boxer, seed: int | None = None) -> dict:
+        fight = self.engine(red, blue, seed=seed).simulate()
+        fight["round_points"] = [
+            _points(sum(r["red"]["landed"].values()), sum(r["blue"]["landed"].values()))
+            for r in fight["rounds"]
+        ]
+        return fight
+
+    def simulate_many(self, red: Boxer, blue: Boxer, seeds: Iterable[int]) -> List[dict]:
+        return [self.simulate(red, blue, s) for s in seeds]
+
+
+# -------------------------------- Outcome -------------------------------- #
+class OutcomeEngine(MatchEngine):
+    """MatchEngine rules and RNG draw order, without telemetry or narrative.
+
+    Defence scores, cut-offs and punch weights are worked out once per fight
+    instead of per throw; the float operations are the same, so every random
+    draw lands on the same branch as in MatchEngine.
+    """
+
+    def simulate(self) -> dict:
+        rng = self.rng
+        red_att = self._attack_plan(self.red, self.red_pacc)
+        blue_att = self._attack_plan(self.blue, self.blue_pacc)
+        red_def = self._defence_plan(self.red)
+        blue_def = self._defence_plan(self.blue)
+        round_points = []
+        for _ in range(ROUNDS):
+            red_landed = blue_landed = 0
+            for _ in range(EXCHANGES):
+                red_landed += self._lands(rng, red_att, blue_def)
+                blue_landed += self._lands(rng, blue_att, red_def)
+            round_points.append(_points(red_landed, blue_landed))
+        return _finish(self.red, self.blue, round_points)
+
+    @staticmethod
+    def _attack_plan(boxer: Boxer, table: dict[str, float]) -> tuple:
+        best = max(table.values())
+        best_choices = [p for p, v in table.items() if v == best]
+        keys = list(table.keys())
+        return boxer.decision / 20, table, best_choices, keys, list(accumulate(table.values()))
+
+    @staticmethod
+    def _defence_plan(boxer: Boxer) -> tuple:
+        block, dodge, parry = block_score(boxer), dodge_score(boxer), parry_score(boxer)
+        total = block + dodge + parry
+        cutoff_block = block / total
+        cutoff_dodge = cutoff_block + (dodge / total)
+        return boxer.decision / 20, max(block, dodge, parry), block, dodge, parry, cutoff_block, cutoff_dodge
+
+    def _lands(self, rng: random.Random, att: tuple, dfn: tuple) -> bool:
+        a_focus, table, best_choices, keys, cum = att
+        if rng.random() < a_focus:
+            punch = rng.choice(best_choices)
+        else:
+            punch = rng.choices(keys, cum_weights=cum, k=1)[0]
+        d_focus, best_def, block, dodge, parry, cutoff_block, cutoff_dodge = dfn
+        if rng.random() < d_focus:
+            chosen = best_def
+        else:
+            roll = rng.random()
+            chosen = block if roll < cutoff_block else dodge if roll < cutoff_dodge else parry
+        return rng.random() < self.land_chance(table[punch], chosen)
+
+
+class OutcomeBackend(ReferenceBackend):
+    """Winner, scores and round points only; exact match with the reference."""
+
+    name = "outcome"
+    exact = True
+    telemetry = False
+
+    def __init__(self, engine: type[OutcomeEngine] = OutcomeEngine):
+        super().__init__(engine)
+
+    def simulate(self, red: Boxer, blue: Boxer, seed: int | None = None) -> dict:
+        return self.engine(red, blue, seed=seed).simulate()
+
+
+# --------------------------------- Fast ---------------------------------- #
+class FastBackend:
+    """One draw per throw against the closed-form land probability.
+
+    Throws in MatchEngine are independent given the ratings, so this has the
+    same outcome distribution with a quarter of the random draws. Not seed-
+    compatible with the reference.
+    """
+
+    name = "fast"
+    exact = False
+    telemetry = False
+
+    def __init__(self, engine: type[MatchEngine] = MatchEngine):
+        self.engine = engine
+
+    def simulate(self, red: Boxer, blue: Boxer, seed: int | None = None) -> dict:
+        return self.simulate_many(red, blue, [seed])[0]
+
+    def simulate_many(self, red: Boxer, blue: Boxer, seeds: Iterable[int]) -> List[dict]:
+        p_red = land_probability(red, blue, self.engine)
+        p_blue = land_probability(blue, red, self.engine)
+        out = []
+        for seed in seeds:
+            rnd = random.Random(seed).random
+            round_points = []
+            for _ in range(ROUNDS):
+                red_landed = blue_landed = 0
+                for _ in range(EXCHANGES):
+                    red_landed += rnd() < p_red
+                    blue_landed += rnd() < p_blue
+                round_points.append(_points(red_landed, blue_landed))
+            out.append(_finish(red, blue, round_points))
+        return out
+
+
+# --------------------------------- Table --------------------------------- #
+class TableBackend(ReferenceBackend):
+    """Full telemetry, throws resolved by the integer table kernel (boxing.kernel).
+
+    Same distribution as the reference, different random stream.
+    """
+
+    name = "table"
+    exact = False
+    telemetry = True
+
+    def __init__(self, engine: type[TableMatchEngine] = TableMatchEngine):
+        super().__init__(engine)
+
+
+register(ReferenceBackend())
+register(OutcomeBackend())
+register(FastBackend())
+register(TableBackend())
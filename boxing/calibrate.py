@@ -0,0 +1,249 @@
+# boxing/calibrate.py
+"""Search engine coefficients until simulated statistics hit design targets.
+
+Targets are things like "equal base-12 fighters land 38% of punches" or
+"+4 accuracy at base 12 wins 65% of fights". The search is SPSA
+(simultaneous perturbation stochastic approximation): every iteration
+evaluates two perturbed candidates, so the cost does not grow with the
+number of coefficients. All candidates are scored on the same fight seeds
+(common random numbers), which keeps the noise in their difference small,
+and each candidate's targets are simulated as one batch per worker.
+
+    python -m boxing.calibrate --land 12:0.38 --win 12:4:0.65
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List, Sequence, Tuple
+
+from boxing.engine import MatchEngine
+from boxing.models import RATING_FIELDS, SKILL_MAX, SKILL_MIN, Boxer
+
+# coefficient -> (low, high) search bounds
+COEFFICIENTS: Dict[str, Tuple[float, float]] = {
+    "ACC_WEIGHT": (0.2, 3.0),
+    "LAND_EXPONENT": (0.25, 4.0),
+}
+CALIBRATION_FIELDS = ("accuracy", "blocking", "reflexes", "decision")  # valid --win stats
+FIGHTS_PER_TARGET = 400
+
+# SPSA gain schedules (Spall's recommended exponents)
+SPSA_ALPHA, SPSA_GAMMA = 0.602, 0.101
+
+
+@dataclass(slots=True, frozen=True)
+class Target:
+    """One statistic to hit.
+
+    kind "land": land fraction of equal base-`base` fighters.
+    kind "win":  Red win fraction when Red has `field` raised by `delta` over base `base`.
+    """
+    kind: str
+    base: int
+    value: float
+    delta: int = 0
+    field: str = "accuracy"
+    tolerance: float = 0.01
+
+    def label(self) -> str:
+        if self.kind == "land":
+            return f"land% base {self.base}"
+        return f"win% base {self.base} {self.field}{self.delta:+d}"
+
+
+def parse_target(kind: str, spec: str, tolerance: float) -> Target:
+    """Parse CLI specs: land 'BASE:VALUE', win 'BASE:DELTA:VALUE[:FIELD]'."""
+    parts = spec.split(":")
+    target = None
+    try:
+        if kind == "land" and len(parts) == 2:
+            target = Target("land", int(parts[0]), float(parts[1]), tolerance=tolerance)
+        if kind == "win" and len(parts) in (3, 4):
+            field = parts[3] if len(parts) == 4 else "accuracy"
+            if field not in CALIBRATION_FIELDS:
+                raise SystemExit(f"Unknown field '{field}'. Allowed: {', '.join(CALIBRATION_FIELDS)}")
+            target = Target("win", int(parts[0]), float(parts[2]), delta=int(parts[1]), field=field, tolerance=tolerance)
+    except ValueError:
+        pass
+    if target is None:
+        raise SystemExit(f"Bad --{kind} target '{spec}'.")
+    if not SKILL_MIN <= target.base <= SKILL_MAX:
+        raise SystemExit(f"Bad --{kind} target '{spec}': base must be {SKILL_MIN}..{SKILL_MAX}.")
+    if not SKILL_MIN <= target.base + target.delta <= SKILL_MAX:
+        raise SystemExit(f"Bad --{kind} target '{spec}': base+delta must be {SKILL_MIN}..{SKILL_MAX}.")
+    if not 0.0 <= target.value <= 1.0:
+        raise SystemExit(f"Bad --{kind} target '{spec}': value must be a fraction 0..1.")
+    return target
+
+
+# ------------------------------ Evaluation ------------------------------- #
+def make_engine(coeffs: Dict[str, float]) -> type[MatchEngine]:
+    """A MatchEngine subclass with the given coefficients."""
+    return type("CalibratedEngine", (MatchEngine,), dict(coeffs))
+
+
+def _uniform(name: str, base: int) -> Boxer:
+    return Boxer(name=name, **{k: base for k in RATING_FIELDS})
+
+
+def measure(target: Target, coeffs: Dict[str, float], seeds: Sequence[int]) -> float:
+    """Simulated value of one target statistic under `coeffs`."""
+    engine = make_engine(coeffs)
+    red, blue = _uniform("Red", target.base), _uniform("Blue", target.base)
+    if target.kind == "win":
+        red = replace(red, **{target.field: target.base + target.delta})
+    landed = thrown = wins = 0
+    for seed in seeds:
+        fight = engine(red, blue, seed=seed).simulate()
+        if target.kind == "win":
+            wins += fight["winner"] == "Red"
+            continue
+        for r in fight["rounds"]:
+            for side in ("red", "blue"):
+                thrown += sum(r[side]["thrown"].values())
+                landed += sum(r[side]["landed"].values())
+    return wins / len(seeds) if target.kind == "win" else landed / thrown
+
+
+def _measure_job(job: Tuple[Target, Dict[str, float], Sequence[int]]) -> float:
+    return measure(*job)
+
+
+def evaluate(
+    targets: Sequence[Target],
+    candidates: Sequence[Dict[str, float]],
+    seeds: Sequence[int],
+    executor: Executor | None = None,
+) -> List[List[float]]:
+    """Statistics for every (candidate, target), simulated as one batch."""
+    jobs = [(t, c, seeds) for c in candidates for t in targets]
+    flat = list(executor.map(_measure_job, jobs) if executor else map(_measure_job, jobs))
+    n = len(targets)
+    return [flat[i:i + n] for i in range(0, len(flat), n)]
+
+
+def loss(targets: Sequence[Target], stats: Sequence[float]) -> float:
+    """Sum of squared misses, each measured in units of its tolerance."""
+    return sum(((s - t.value) / t.tolerance) ** 2 for t, s in zip(targets, stats))
+
+
+# --------------------------------- SPSA ---------------------------------- #
+@dataclass(slots=True)
+class CalibrationResult:
+    coeffs: Dict[str, float]
+    stats: List[float]
+    loss: float
+    iterations: int
+    converged: bool
+
+
+def calibrate(
+    targets: Sequence[Target],
+    *,
+    coefficients: Dict[str, Tuple[float, float]] | None = None,
+    start: Dict[str, float] | None = None,
+    iterations: int = 60,
+    fights: int = FIGHTS_PER_TARGET,
+    seed: int = 0,
+    step: float = 0.1,
+    perturb: float = 0.08,
+    executor: Executor | None = None,
+    log=None,
+) -> CalibrationResult:
+    """SPSA search over engine coefficients.
+
+    Coefficients are searched on a normalised 0..1 scale between their
+    bounds. `step` and `perturb` are the initial SPSA gain and perturbation
+    size on that scale. Stops early once every target is within tolerance.
+    """
+    bounds = coefficients or COEFFICIENTS
+    names = list(bounds)
+    lo = [bounds[n][0] for n in names]
+    span = [bounds[n][1] - bounds[n][0] for n in names]
+    defaults = {n: getattr(MatchEngine, n) for n in names}
+    start = {**defaults, **(start or {})}
+    theta = [min(1.0, max(0.0, (start[n] - l) / s)) for n, l, s in zip(names, lo, span)]
+    seeds = range(seed, seed + fights)  # common random numbers for every candidate
+    rng = random.Random(seed)
+
+    def coeffs_of(x: Sequence[float]) -> Dict[str, float]:
+        return {n: l + s * min(1.0, max(0.0, v)) for n, l, s, v in zip(names, lo, span, x)}
+
+    def converged(stats: Sequence[float]) -> bool:
+        return all(abs(s - t.value) <= t.tolerance for t, s in zip(targets, stats))
+
+    stats = evaluate(targets, [coeffs_of(theta)], seeds, executor)[0]
+    best = (loss(targets, stats), theta, stats)
+    k = 0
+    stability = max(1, iterations // 10)
+    while k < iterations and not converged(best[2]):
+        a_k = step / (k + 1 + stability) ** SPSA_ALPHA
+        c_k = perturb / (k + 1) ** SPSA_GAMMA
+        delta = [rng.choice((-1.0, 1.0)) for _ in names]
+        plus = [v + c_k * d for v, d in zip(theta, delta)]
+        minus = [v - c_k * d for v, d in zip(theta, delta)]
+        s_plus, s_minus = evaluate(targets, [coeffs_of(plus), coeffs_of(minus)], seeds, executor)
+        l_plus, l_minus = loss(targets, s_plus), loss(targets, s_minus)
+        for x, s, l_x in ((plus, s_plus, l_plus), (minus, s_minus, l_minus)):
+            if l_x < best[0]:
+                best = (l_x, [min(1.0, max(0.0, v)) for v in x], s)
+        # gradient step, capped at 2*c_k so a huge early miss cannot fling theta across the range
+        move = [a_k * (l_plus - l_minus) / (2 * c_k * d) for d in delta]
+        size = math.sqrt(sum(m * m for m in move))
+        if size > 2 * c_k:
+            move = [m * 2 * c_k / size for m in move]
+        theta = [min(1.0, max(0.0, v - m)) for v, m in zip(theta, move)]
+        k += 1
+        if log:
+            log(k, coeffs_of(best[1]), best[2], best[0])
+
+    return CalibrationResult(coeffs_of(best[1]), best[2], best[0], k, converged(best[2]))
+
+
+# --------------------------------- Main ---------------------------------- #
+def main():
+    ap = argparse.ArgumentParser(description="Tune engine coefficients to hit target statistics (SPSA).")
+    ap.add_argument("--land", action="append", default=[], metavar="BASE:VALUE",
+                    help="Land fraction target for equal fighters, e.g. 12:0.38")
+    ap.add_argument("--win", action="append", default=[], metavar="BASE:DELTA:VALUE[:FIELD]",
+                    help="Red win fraction with FIELD (default accuracy) raised by DELTA, e.g. 12:4:0.65")
+    ap.add_argument("--tolerance", type=float, default=0.01, help="Allowed miss per target")
+    ap.add_argument("--fights", type=int, default=FIGHTS_PER_TARGET, help="Fights per target per candidate")
+    ap.add_argument("--iterations", type=int, default=60, help="Max SPSA iterations")
+    ap.add_argument("--seed", type=int, default=0, help="Seed for fights and perturbations")
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (1 = in-process)")
+    args = ap.parse_args()
+    if args.tolerance <= 0:
+        raise SystemExit("--tolerance must be > 0.")
+    if args.fights < 1:
+        raise SystemExit("--fights must be >= 1.")
+
+    targets = [parse_target("land", s, args.tolerance) for s in args.land]
+    targets += [parse_target("win", s, args.tolerance) for s in args.win]
+    if not targets:
+        raise SystemExit("Give at least one --land or --win target.")
+
+    def log(k, coeffs, stats, best_loss):
+        shown = " ".join(f"{n}={v:.4f}" for n, v in coeffs.items())
+        print(f"iter {k:>3}  loss={best_loss:9.3f}  {shown}")
+
+    if args.workers == 1:
+        result = calibrate(targets, iterations=args.iterations, fights=args.fights, seed=args.seed, log=log)
+    else:
+        with ProcessPoolExecutor(args.workers) as pool:
+            result = calibrate(targets, iterations=args.iterations, fights=args.fights, seed=args.seed,
+                               executor=pool, log=log)
+
+    print("\nConverged" if result.converged else "\nNot converged (best found shown)")
+    for t, s in zip(targets, result.stats):
+        print(f"  {t.label():<28} target {t.value:.3f}  got {s:.3f}")
+    for n, v in result.coeffs.items():
+        print(f"  {n} = {v:.4f}")
+
+
+if __name__ == "__main__":
+    main()
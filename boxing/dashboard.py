@@ -0,0 +1,213 @@
+# boxing/dashboard.py
+"""Live terminal dashboard (rich) for long-running batch simulations.
+
+Workers never touch the display. They add to local counters and push a small
+delta onto a multiprocessing queue every REPORT_EVERY fights via report().
+A sampler thread in the parent drains the queue and redraws on its own
+cadence, so refresh cost is paid once per tick, not per fight.
+
+    with LiveDashboard("QA parity", total=10_000) as dash:
+        with dash.pool(workers=4) as pool:
+            results = list(pool.map(job_fn, jobs))
+"""
+from __future__ import annotations
+
+import math
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.progress_bar import ProgressBar
+from rich.table import Table
+
+REPORT_EVERY = 50  # fights between worker reports
+REFRESH_SECONDS = 0.5  # dashboard sampling cadence
+Z_95 = 1.96
+
+STAT_KEYS = ("fights", "red_wins", "blue_wins", "draws", "red_landed", "red_thrown", "blue_landed", "blue_thrown")
+
+
+# ------------------------------ Worker side ------------------------------ #
+_progress_queue = None
+_pending: Counter = Counter()
+
+
+def _init_worker(q) -> None:
+    global _progress_queue
+    _progress_queue = q
+
+
+def report(force: bool = False, **counts: int) -> None:
+    """Add counts (keys from STAT_KEYS) and flush every REPORT_EVERY fights.
+
+    A no-op outside a dashboard pool, so simulation code can call it freely.
+    """
+    if _progress_queue is None:
+        return
+    _pending.update(counts)
+    if force or _pending["fights"] >= REPORT_EVERY:
+        flush()
+
+
+def flush() -> None:
+    """Push whatever the worker has not reported yet (call at the end of a job)."""
+    if _progress_queue is None or not _pending:
+        return
+    _progress_queue.put((os.getpid(), dict(_pending)))
+    _pending.clear()
+
+
+def fight_counts(fight: dict) -> Dict[str, int]:
+    """STAT_KEYS counts for one fight result (corners named Red/Blue)."""
+    winner = fight["winner"]
+    out = {"fights": 1, "red_wins": winner == "Red", "blue_wins": winner == "Blue", "draws": winner is None}
+    if "rounds" not in fight:  # outcome-only engine backend
+        return out
+    for side in ("red", "blue"):
+        out[f"{side}_thrown"] = sum(sum(r[side]["thrown"].values()) for r in fight["rounds"])
+        out[f"{side}_landed"] = sum(sum(r[side]["landed"].values()) for r in fight["rounds"])
+    return out
+
+
+# ------------------------------ Aggregates ------------------------------- #
+def wilson_interval(successes: int, n: int, z: float = Z_95) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+class RunStats:
+    """Running totals for a batch run, overall and per worker."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.started = time.perf_counter()
+        self.totals: Counter = Counter()
+        self.per_worker: Dict[int, int] = {}
+
+    def add(self, worker: int, counts: Dict[str, int]) -> None:
+        self.totals.update(counts)
+        self.per_worker[worker] = self.per_worker.get(worker, 0) + counts.get("fights", 0)
+
+    @property
+    def done(self) -> int:
+        return self.totals["fights"]
+
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self) -> float | None:
+        rate = self.rate()
+        return (self.total - self.done) / rate if rate else None
+
+    def red_win_rate(self) -> tuple[float, float, float]:
+        """Red share of decided fights with a 95% interval."""
+        t = self.totals
+        decided = t["red_wins"] + t["blue_wins"]
+        lo, hi = wilson_interval(t["red_wins"], decided)
+        return (t["red_wins"] / decided if decided else 0.5), lo, hi
+
+    def land_rate(self, side: str) -> tuple[float, float, float]:
+        landed, thrown = self.totals[f"{side}_landed"], self.totals[f"{side}_thrown"]
+        lo, hi = wilson_interval(landed, thrown)
+        return (landed / thrown if thrown else 0.0), lo, hi
+
+
+# ------------------------------- Rendering ------------------------------- #
+def _fmt_eta(seconds: float | None) -> str:
+    if seconds is None:
+        return "–"
+    m, s = divmod(int(seconds), 60)
+    return f"{m}:{s:02d}"
+
+
+def render(title: str, stats: RunStats) -> Group:
+    head = Table.grid(padding=(0, 2))
+    head.add_row(
+        f"[bold]{title}[/bold]",
+        f"{stats.done:,}/{stats.total:,} fights",
+        f"{stats.rate():,.0f} fights/s",
+        f"ETA {_fmt_eta(stats.eta())}",
+    )
+
+    workers = Table("Worker", "Fights", "", box=None, padding=(0, 1))
+    share = stats.total / max(1, len(stats.per_worker))
+    for pid, n in sorted(stats.per_worker.items()):
+        workers.add_row(str(pid), f"{n:,}", ProgressBar(total=share, completed=min(n, share), width=30))
+
+    est = Table("Estimate", "Value", "95% CI", box=None, padding=(0, 1))
+    t = stats.totals
+    for label, n, (v, lo, hi) in (
+        ("Red win share", t["red_wins"] + t["blue_wins"], stats.red_win_rate()),
+        ("Red land%", t["red_thrown"], stats.land_rate("red")),
+        ("Blue land%", t["blue_thrown"], stats.land_rate("blue")),
+    ):
+        if not n:
+            continue
+        est.add_row(label, f"{v:.3f}", f"[{lo:.3f}, {hi:.3f}] ±{(hi - lo) / 2:.3f}")
+
+    return Group(head, ProgressBar(total=stats.total, completed=stats.done), workers, est)
+
+
+class LiveDashboard:
+    """Context manager: owns the progress queue, sampler thread and rich Live view."""
+
+    def __init__(self, title: str, total: int, *, refresh: float = REFRESH_SECONDS, console: Console | None = None):
+        self.title = title
+        self.stats = RunStats(total)
+        self.refresh = refresh
+        self.queue = mp.get_context().Queue()
+        self._live = Live(render(title, self.stats), console=console, auto_refresh=False)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def pool(self, workers: int | None = None) -> ProcessPoolExecutor:
+        """A process pool whose workers report to this dashboard."""
+        return ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self.queue,))
+
+    def attach_local(self) -> None:
+        """Let in-process simulation report too (serial runs)."""
+        _init_worker(self.queue)
+
+    def _drain(self, timeout: float = 0.0) -> None:
+        try:
+            while True:
+                item = self.queue.get(timeout=timeout) if timeout else self.queue.get_nowait()
+                self.stats.add(*item)
+        except queue.Empty:
+            pass
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.refresh):
+            self._drain()
+            self._live.update(render(self.title, self.stats), refresh=True)
+
+    def __enter__(self) -> "LiveDashboard":
+        self._live.__enter__()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        # close pools first: worker exit flushes their queue feeders
+        flush()
+        _init_worker(None)
+        self._stop.set()
+        self._thread.join()
+        self._drain(timeout=0.1)
+        self._live.update(render(self.title, self.stats), refresh=True)
+        self._live.__exit__(*exc)
+        if not self._live.console.is_terminal:
+            self._live.console.line()
@@ -4,19 +4,25 @@ from __future__ import annotations
 import random
 from typing import List, Dict, Tuple
 
-from boxing.models import Boxer
+from boxing.models import PUNCHES, Boxer
 from boxing.prob import block_score, dodge_score, parry_score
 
 ROUNDS = 12
-PUNCHES = ("jab", "straight", "lead_hook", "hook", "lead_uppercut", "uppercut")
 DEFENCES = ("block", "dodge", "parry")
 
 
 class MatchEngine:
     """Runs a 12-round fight with Decision-driven punch choice and land/evade logic.
     Now records round-by-round telemetry: thrown/landed by type and defence usage.
+
+    ACC_WEIGHT / LAND_EXPONENT shape the land formula; subclasses (see
+    boxing.calibrate) override them when retuning. The defaults reproduce
+    punch_acc / (punch_acc + defence) exactly.
     """
 
+    ACC_WEIGHT = 1.0
+    LAND_EXPONENT = 1.0
+
     def __init__(self, red: Boxer, blue: Boxer, *, seed: int | None = None):
         self.red, self.blue = red, blue
         self.rng = random.Random(seed)
@@ -46,6 +52,12 @@ class MatchEngine:
         acc = boxer.accuracy / 20
         return {p: ((getattr(boxer, p) / 20) + acc) / 2 for p in PUNCHES}
 
+    @classmethod
+    def land_chance(cls, punch_acc: float, defence: float) -> float:
+        """Probability that a punch of accuracy `punch_acc` beats `defence`."""
+        attack = cls.ACC_WEIGHT * punch_acc ** cls.LAND_EXPONENT
+        return attack / (attack + defence ** cls.LAND_EXPONENT)
+
     def _choose_punch(self, boxer: Boxer, table: dict[str, float]) -> str:
         """Decision-driven punch selection."""
         p_focus = boxer.decision / 20
@@ -145,7 +157,7 @@ class MatchEngine:
             defence_used = "parry"
 
         # 4) land probability
-        p_land = punch_acc / (punch_acc + chosen)
+        p_land = self.land_chance(punch_acc, chosen)
         landed = self.rng.random() < p_land
 
         # 5) narrative
@@ -0,0 +1,154 @@
+# boxing/kernel.py
+"""Table-driven throw kernel (opt-in: `--engine table`).
+
+All inputs to a throw are integer ratings, so they fit on integer grids:
+
+    punch accuracy  = (type + accuracy) / 40           -> s = type + accuracy, 2..40
+    block           = blocking / 20                    -> 12 * blocking            / 240
+    dodge           = (2*reflexes + antic + agility) / 80  -> 3 * (...)           / 240
+    parry           = (2*blocking + antic + composure + reflexes + agility) / 120 -> 2 * (...) / 240
+
+LAND_TABLE[s][d] holds P(land) for accuracy sum s against defence d/240 as an
+integer threshold out of 2**32, built once at import. Per fight, each
+(attacker punch, defender) gets cumulative thresholds over the six joint
+outcomes (defence used × landed); a throw is then one getrandbits(32) and a
+bisect. Same outcome distribution as MatchEngine, not the same random stream.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from boxing.engine import DEFENCES, PUNCHES, MatchEngine
+from boxing.models import Boxer
+from boxing.prob import block_score, dodge_score, parry_score
+
+RAND_BITS = 32
+SCALE = 1 << RAND_BITS
+ACC_SUM_MAX = 40  # type + accuracy
+DEF_UNITS = 240  # common denominator of block/dodge/parry
+
+
+_TABLES: Dict[tuple, Tuple[Tuple[int, ...], ...]] = {}
+
+
+def _table_key(engine: type[MatchEngine]) -> tuple:
+    # engine subclasses sharing the land formula and coefficients share a table
+    return engine.land_chance.__func__, engine.ACC_WEIGHT, engine.LAND_EXPONENT
+
+
+def land_table(engine: type[MatchEngine] = MatchEngine) -> Tuple[Tuple[int, ...], ...]:
+    """Integer land thresholds [s][d] for the engine's land formula."""
+    key = _table_key(engine)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = tuple(
+            tuple(
+                round(engine.land_chance(s / ACC_SUM_MAX, d / DEF_UNITS) * SCALE) if s and d else SCALE
+                for d in range(DEF_UNITS + 1)
+            )
+            for s in range(ACC_SUM_MAX + 1)
+        )
+    return table
+
+
+LAND_TABLE = land_table(MatchEngine)
+
+
+def defence_units(b: Boxer) -> Tuple[int, int, int]:
+    """(block, dodge, parry) in 1/240 units – exact integer forms of boxing.prob."""
+    block = 12 * b.blocking
+    dodge = 3 * (2 * b.reflexes + b.anticipation + b.agility)
+    parry = 2 * (2 * b.blocking + b.anticipation + b.composure + b.reflexes + b.agility)
+    return block, dodge, parry
+
+
+def _float_scores(b: Boxer) -> Tuple[float, float, float]:
+    """(block, dodge, parry) as the floats MatchEngine._throw compares."""
+    return block_score(b), dodge_score(b), parry_score(b)
+
+
+def defence_mix(b: Boxer) -> List[Tuple[str, int, float]]:
+    """(label, defence units, probability) for every way `b` can defend a punch.
+
+    Mirrors MatchEngine._throw: focused (decision/20) takes the best score,
+    otherwise a score-weighted pick; the label is the first defence whose
+    score equals the chosen one.
+    """
+    return _mix(defence_units(b), _float_scores(b), b.decision)
+
+
+def _mix(units: Tuple[int, int, int], scores: Tuple[float, float, float], decision: int) -> List[Tuple[str, int, float]]:
+    focus = decision / 20
+    total = sum(units)
+
+    def label(score: float) -> str:
+        # labels come from the float scores: exact ties can differ by an ulp
+        # there, and MatchEngine._throw's == chain labels by the floats
+        return DEFENCES[scores.index(score)]
+
+    best = max(scores)
+    mix = [(label(best), units[scores.index(best)], focus)]
+    mix += [(label(sc), u, (1 - focus) * u / total) for u, sc in zip(units, scores)]
+    return mix
+
+
+def throw_plan(s: int, mix: List[Tuple[str, int, float]], table=LAND_TABLE) -> Tuple[Tuple[int, ...], tuple]:
+    """Cumulative thresholds and (landed, defence) outcomes for one punch vs one defender."""
+    joint: Dict[Tuple[bool, str], float] = {}
+    row = table[s]
+    for lab, d, w in mix:
+        p_land = row[d] / SCALE
+        joint[(True, lab)] = joint.get((True, lab), 0.0) + w * p_land
+        joint[(False, lab)] = joint.get((False, lab), 0.0) + w * (1 - p_land)
+    outcomes = [o for o, p in joint.items() if p > 0]
+    cum, acc = [], 0.0
+    for o in outcomes:
+        acc += joint[o]
+        cum.append(round(acc * SCALE))
+    cum[-1] = SCALE  # absorb rounding so every draw maps to an outcome
+    return tuple(cum), tuple(outcomes)
+
+
+@lru_cache(maxsize=1 << 16)
+def _cached_plan(
+    table_key: tuple, s: int, units: Tuple[int, int, int], scores: Tuple[float, float, float], decision: int
+) -> tuple:
+    # plans only depend on these values, so repeated matchups skip the rebuild
+    return throw_plan(s, _mix(units, scores, decision), _TABLES[table_key])
+
+
+class TableMatchEngine(MatchEngine):
+    """MatchEngine with the table-driven throw kernel; telemetry and transcript unchanged."""
+
+    def __init__(self, red: Boxer, blue: Boxer, *, seed: int | None = None):
+        super().__init__(red, blue, seed=seed)
+        self._plans = {
+            True: self._plans_for(red, blue),  # red attacking
+            False: self._plans_for(blue, red),
+        }
+
+    def _plans_for(self, attacker: Boxer, defender: Boxer) -> Dict[str, tuple]:
+        land_table(type(self))  # build once per distinct land formula
+        key = _table_key(type(self))
+        units, scores, decision = defence_units(defender), _float_scores(defender), defender.decision
+        return {
+            p: _cached_plan(key, getattr(attacker, p) + attacker.accuracy, units, scores, decision)
+            for p in PUNCHES
+        }
+
+    def _throw(self, attacker: Boxer, defender: Boxer, punch: str, rnd: int) -> Tuple[bool, str]:
+        cum, outcomes = self._plans[attacker is self.red][punch]
+        landed, defence_used = outcomes[bisect_right(cum, self.rng.getrandbits(RAND_BITS))]
+
+        if landed:
+            self.events.append(
+                f"Round {rnd}: {attacker.name} lands a {punch.replace('_', ' ')}."
+            )
+        else:
+            verb = "blocked" if defence_used == "block" else "misses"
+            self.events.append(
+                f"Round {rnd}: {attacker.name} {verb} a {punch.replace('_', ' ')}."
+            )
+        return landed, defence_used
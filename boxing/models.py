@@ -2,6 +2,17 @@ from dataclasses import dataclass, field
 
 SKILL_MIN, SKILL_MAX = 1, 20
 
+# Column order of a ratings row / (N, 22) ratings matrix (same as the fields below)
+RATING_FIELDS = (
+    "jab", "straight", "lead_hook", "hook",
+    "lead_uppercut", "uppercut", "blocking", "accuracy",
+    "anticipation", "composure", "positioning", "decision",
+    "aggression", "focus", "workrate", "planning",
+    "power", "hand_speed", "foot_speed",
+    "reflexes", "stamina", "agility",
+)
+PUNCHES = ("jab", "straight", "lead_hook", "hook", "lead_uppercut", "uppercut")
+
 @dataclass(slots=True, frozen=True)
 class Boxer:
     # Fundamentals
@@ -25,6 +36,10 @@ class Boxer:
         if bad:
             raise ValueError(f"Ratings must be 1–20. Offenders: {bad}")
 
+    def ratings(self) -> tuple[int, ...]:
+        """The 22 ratings as one row, in RATING_FIELDS order."""
+        return tuple(getattr(self, k) for k in RATING_FIELDS)
+
     # --- derived defence helpers (0-1 fractions) --------------------------
     def block_score(self) -> float:
         return self.blocking / 20
@@ -0,0 +1,100 @@
+# boxing/odds.py
+from __future__ import annotations
+
+from dataclasses import replace
+from math import comb
+
+from boxing.engine import ROUNDS, MatchEngine
+from boxing.models import Boxer
+from boxing.prob import block_score, dodge_score, parry_score
+
+ODDS_FIGHTS = 200
+
+
+def estimate_odds(
+    red: Boxer,
+    blue: Boxer,
+    *,
+    fights: int = ODDS_FIGHTS,
+    seed: int = 0,
+    engine: type[MatchEngine] = MatchEngine,
+) -> dict[str, float]:
+    """Monte-Carlo win/draw probabilities for one matchup.
+
+    Fights use seeds seed .. seed+fights-1, so two estimates with the same
+    seed share their random numbers (handy when comparing rating tweaks).
+    """
+    if fights < 1:
+        raise ValueError(f"fights must be >= 1, got {fights}")
+    # corners get fixed names: scores are keyed by name and must not collide
+    red, blue = replace(red, name="Red"), replace(blue, name="Blue")
+    wins = {"Red": 0, "Blue": 0}
+    for s in range(seed, seed + fights):
+        winner = engine(red, blue, seed=s).simulate()["winner"]
+        if winner:
+            wins[winner] += 1
+    draws = fights - wins["Red"] - wins["Blue"]
+    return {"red": wins["Red"] / fights, "blue": wins["Blue"] / fights, "draw": draws / fights}
+
+
+# ---------------------------------------------------------------------------
+# Closed-form estimate (no simulation)
+# ---------------------------------------------------------------------------
+def land_probability(attacker: Boxer, defender: Boxer, engine: type[MatchEngine] = MatchEngine) -> float:
+    """Chance that one throw lands, averaged over punch and defence choice.
+
+    Mirrors MatchEngine._choose_punch / _throw: with p = decision/20 the
+    best option is taken, otherwise a rating-weighted pick.
+    """
+    pacc = MatchEngine._precompute_pacc(attacker)
+    best = max(pacc.values())
+    best_punches = [p for p, v in pacc.items() if v == best]
+    a_focus = attacker.decision / 20
+    total_acc = sum(pacc.values())
+    punch_w = {
+        p: a_focus * (p in best_punches) / len(best_punches) + (1 - a_focus) * v / total_acc
+        for p, v in pacc.items()
+    }
+
+    defs = (block_score(defender), dodge_score(defender), parry_score(defender))
+    d_focus = defender.decision / 20
+    total_def = sum(defs)
+    def_w = [(max(defs), d_focus)] + [(d, (1 - d_focus) * d / total_def) for d in defs]
+
+    return sum(
+        pw * dw * engine.land_chance(pacc[p], d)
+        for p, pw in punch_w.items()
+        for d, dw in def_w
+    )
+
+
+def quick_odds(red: Boxer, blue: Boxer, engine: type[MatchEngine] = MatchEngine) -> dict[str, float]:
+    """Win/draw probabilities without simulating.
+
+    Every throw lands independently with land_probability(), so a round is
+    two Bernoulli throws per side and the fight a 12-round tally. Matches
+    estimate_odds() in expectation as long as fights carry no state between
+    throws (no damage or stamina yet).
+    """
+    p_r, p_b = land_probability(red, blue, engine), land_probability(blue, red, engine)
+    exchanges = 2
+
+    def landed_dist(p: float) -> list[float]:
+        return [comb(exchanges, k) * p ** k * (1 - p) ** (exchanges - k) for k in range(exchanges + 1)]
+
+    lr, lb = landed_dist(p_r), landed_dist(p_b)
+    r_round = sum(lr[i] * lb[j] for i in range(exchanges + 1) for j in range(i))
+    b_round = sum(lr[i] * lb[j] for j in range(exchanges + 1) for i in range(j))
+    even = 1 - r_round - b_round
+
+    # distribution of (red rounds won - blue rounds won) over ROUNDS rounds
+    diff = {0: 1.0}
+    for _ in range(ROUNDS):
+        nxt: dict[int, float] = {}
+        for d, pr in diff.items():
+            for step, ps in ((1, r_round), (-1, b_round), (0, even)):
+                nxt[d + step] = nxt.get(d + step, 0.0) + pr * ps
+        diff = nxt
+    red_p = sum(pr for d, pr in diff.items() if d > 0)
+    blue_p = sum(pr for d, pr in diff.items() if d < 0)
+    return {"red": red_p, "blue": blue_p, "draw": max(0.0, 1 - red_p - blue_p)}
@@ -0,0 +1,172 @@
+# boxing/odds_matrix.py
+"""Roster-wide win-probability matrix, refreshed incrementally as ratings change.
+
+    with OddsMatrix(roster, workers=4) as m:
+        m.update(7, trained_boxer)      # marks fighter 7 dirty
+        m.best_against(champion_id)     # refreshes row/column 7 only, then answers
+
+Every pair is estimated on the same seeds (half the fights in each corner),
+so a cell only moves when one of its two fighters actually changed, and the
+matrix does not depend on how many workers computed it.
+"""
+from __future__ import annotations
+
+import os
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
+from typing import Iterable, List, Sequence, Tuple
+
+from boxing.backends import get_engine
+from boxing.models import Boxer
+from boxing.odds import ODDS_FIGHTS
+
+MATRIX_ENGINE = "fast"
+
+
+def _pair_odds(backend, a: Boxer, b: Boxer, seeds: range) -> Tuple[float, float]:
+    """(P(a wins), P(b wins)); a takes the red corner for the first half of the seeds."""
+    a, b = replace(a, name="A"), replace(b, name="B")
+    half = len(seeds) // 2
+    fights = backend.simulate_many(a, b, seeds[:half]) + backend.simulate_many(b, a, seeds[half:])
+    a_wins = sum(f["winner"] == "A" for f in fights)
+    b_wins = sum(f["winner"] == "B" for f in fights)
+    return a_wins / len(seeds), b_wins / len(seeds)
+
+
+def _pairs_job(job: tuple) -> List[Tuple[int, int, float, float]]:
+    """Worker: (i, j, P(i beats j), P(j beats i)) for each (i, boxer_i, j, boxer_j) with i < j."""
+    engine, seeds, pairs = job
+    backend = get_engine(engine)
+    return [(i, j, *_pair_odds(backend, a, b, seeds)) for i, a, j, b in pairs]
+
+
+class OddsMatrix:
+    """p[i][j] = probability that fighter i beats fighter j (draws count for neither)."""
+
+    def __init__(
+        self,
+        roster: Iterable[Boxer] = (),
+        *,
+        fights: int = ODDS_FIGHTS,
+        seed: int = 0,
+        engine: str = MATRIX_ENGINE,
+        workers: int | None = 1,
+    ):
+        if fights < 2 or fights % 2:
+            # each pair fights half its seeds in each corner, so an odd count would favour one
+            raise ValueError(f"fights must be an even number >= 2, got {fights}")
+        get_engine(engine)  # fail fast on a bad name
+        self.engine = engine
+        self.seeds = range(seed, seed + fights)
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._roster: List[Boxer] = []
+        self._p: List[array] = []
+        self._dirty: set[int] = set()
+        for b in roster:
+            self.add(b)
+
+    def __len__(self) -> int:
+        return len(self._roster)
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "OddsMatrix":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------- Changes ------------------------------- #
+    def add(self, boxer: Boxer) -> int:
+        """Add a fighter (dirty until the next refresh); returns its id."""
+        for row in self._p:
+            row.append(0.0)
+        self._roster.append(boxer)
+        self._p.append(array("d", [0.0] * len(self._roster)))
+        self._dirty.add(len(self._roster) - 1)
+        return len(self._roster) - 1
+
+    def update(self, fid: int, boxer: Boxer) -> None:
+        """New ratings for a fighter; its row and column are recomputed on refresh."""
+        if boxer.ratings() != self._roster[fid].ratings():
+            self._dirty.add(fid)
+        self._roster[fid] = boxer
+
+    @property
+    def dirty(self) -> set[int]:
+        return set(self._dirty)
+
+    def refresh(self, executor: Executor | None = None) -> int:
+        """Recompute every pair touching a changed fighter; returns pairs recomputed.
+
+        The pairs are split into one chunk per worker, so a single changed
+        fighter still uses the whole pool. Runs on `executor` if given, else on
+        a pool of `workers` processes kept for the matrix's lifetime (workers=1
+        stays in-process; close() shuts the pool down).
+        """
+        if not self._dirty:
+            return 0
+        dirty = sorted(self._dirty)
+        pairs = []
+        for i in dirty:
+            # a dirty/dirty pair is owned by the lower id
+            for j in range(len(self)):
+                if j != i and (j not in self._dirty or j > i):
+                    # the lower id always takes the first-half red corner, so a cell's
+                    # value does not depend on which of its fighters triggered the refresh
+                    lo, hi = min(i, j), max(i, j)
+                    pairs.append((lo, self._roster[lo], hi, self._roster[hi]))
+
+        if executor is None and self.workers == 1:
+            results = [_pairs_job((self.engine, self.seeds, pairs))]
+        else:
+            if executor is None:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(self.workers)
+                executor = self._pool
+            n = self.workers if self.workers and self.workers > 1 else os.cpu_count() or 1
+            size = max(1, -(-len(pairs) // n))
+            jobs = [(self.engine, self.seeds, pairs[k:k + size]) for k in range(0, len(pairs), size)]
+            results = executor.map(_pairs_job, jobs)
+
+        for chunk in results:
+            for i, j, p_ij, p_ji in chunk:
+                self._p[i][j] = p_ij
+                self._p[j][i] = p_ji
+        self._dirty.clear()
+        return len(pairs)
+
+    # ------------------------------- Queries ------------------------------- #
+    def win_prob(self, i: int, j: int) -> float:
+        if i == j:
+            raise ValueError("A fighter has no odds against themselves")
+        self.refresh()
+        return self._p[i][j]
+
+    def row(self, i: int) -> List[float]:
+        """P(i beats j) for every j (the diagonal is 0)."""
+        self.refresh()
+        return list(self._p[i])
+
+    def best_against(self, target: int, top: int = 5) -> List[Tuple[int, float]]:
+        """The `top` fighters most likely to beat `target`, as (fid, probability)."""
+        self.refresh()
+        rows = [(i, self._p[i][target]) for i in range(len(self)) if i != target]
+        rows.sort(key=lambda x: (-x[1], x[0]))
+        return rows[:top]
+
+    def favourites(self, fids: Sequence[int] | None = None) -> List[Tuple[int, float]]:
+        """Mean win probability against the rest of `fids` (default: whole roster), best first."""
+        self.refresh()
+        ids = list(range(len(self))) if fids is None else list(fids)
+        if len(ids) < 2:
+            return [(i, 0.0) for i in ids]
+        out = [(i, sum(self._p[i][j] for j in ids if j != i) / (len(ids) - 1)) for i in ids]
+        out.sort(key=lambda x: (-x[1], x[0]))
+        return out
@@ -1,4 +1,7 @@
-from boxing.models import Boxer
+from collections.abc import Iterable, Sequence
+
+from boxing.models import PUNCHES, RATING_FIELDS, Boxer
+
 # ---------------------------------------------------------------------------
 # Defence scores (0-to-1 fractions) – used by the match engine
 # ---------------------------------------------------------------------------
@@ -32,3 +35,67 @@ def parry_score(b: Boxer) -> float:
     hand_speed = (b.reflexes / 20 + b.agility / 20) / 2
     return (block_part + hand_read + hand_speed) / 3
 
+
+# ---------------------------------------------------------------------------
+# Batch versions – (N, 22) ratings matrix in, one value per fighter out
+# ---------------------------------------------------------------------------
+# Rows follow RATING_FIELDS; any sequence of rows works (lists, tuples, arrays).
+RatingsMatrix = Sequence[Sequence[int]]
+
+_COL = {k: i for i, k in enumerate(RATING_FIELDS)}
+
+
+def ratings_matrix(boxers: Iterable[Boxer]) -> list[tuple[int, ...]]:
+    """Stack boxers into an (N, 22) ratings matrix."""
+    return [b.ratings() for b in boxers]
+
+
+def _columns(m: RatingsMatrix, *names: str) -> list[tuple]:
+    for i, row in enumerate(m):
+        if len(row) != len(RATING_FIELDS):
+            raise ValueError(f"Ratings row {i} needs {len(RATING_FIELDS)} values, got {len(row)}")
+    cols = list(zip(*m)) or [()] * len(RATING_FIELDS)
+    return [cols[_COL[n]] for n in names]
+
+
+def block_scores(m: RatingsMatrix) -> list[float]:
+    """block_score for every row of the matrix."""
+    (blocking,) = _columns(m, "blocking")
+    return [bl / 20 for bl in blocking]
+
+
+def dodge_scores(m: RatingsMatrix) -> list[float]:
+    """dodge_score for every row of the matrix."""
+    reflexes, anticipation, agility = _columns(m, "reflexes", "anticipation", "agility")
+    return [
+        (re / 20 + (an / 20 + ag / 20) / 2) / 2
+        for re, an, ag in zip(reflexes, anticipation, agility)
+    ]
+
+
+def parry_scores(m: RatingsMatrix) -> list[float]:
+    """parry_score for every row of the matrix."""
+    blocking, anticipation, composure, reflexes, agility = _columns(
+        m, "blocking", "anticipation", "composure", "reflexes", "agility"
+    )
+    return [
+        (bl / 20 + (an / 20 + co / 20) / 2 + (re / 20 + ag / 20) / 2) / 3
+        for bl, an, co, re, ag in zip(blocking, anticipation, composure, reflexes, agility)
+    ]
+
+
+def defence_scores(m: RatingsMatrix) -> list[tuple[float, float, float]]:
+    """(block, dodge, parry) for every row of the matrix."""
+    return list(zip(block_scores(m), dodge_scores(m), parry_scores(m)))
+
+
+def pacc_tables(m: RatingsMatrix) -> list[tuple[float, ...]]:
+    """
+    Punch-accuracy table for every row: avg( type / 20 , accuracy / 20 ),
+    one column per punch in PUNCHES order (same as MatchEngine._precompute_pacc).
+    """
+    accuracy, *punches = _columns(m, "accuracy", *PUNCHES)
+    return [
+        tuple(((p / 20) + acc) / 2 for p in row)
+        for acc, row in zip((a / 20 for a in accuracy), zip(*punches))
+    ]
@@ -0,0 +1,282 @@
+# boxing/season.py
+"""Season / career layer: weekly fight cards, running records, binary snapshots.
+
+Fighters are stored column-light: one 22-byte ratings row per fighter in a
+bytearray (RATING_FIELDS order) plus a name list. Boxer objects are built on
+demand, so loading a career with tens of thousands of fighters is mostly a
+handful of bulk byte copies.
+"""
+from __future__ import annotations
+
+import random
+import struct
+import sys
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+
+from boxing.dashboard import LiveDashboard, fight_counts, flush, report
+from boxing.engine import MatchEngine
+from boxing.models import RATING_FIELDS, Boxer
+
+WEEKS_PER_YEAR = 52
+BOUTS_PER_CARD = 10
+N_RATINGS = len(RATING_FIELDS)
+
+# bout results as stored in records/history
+RED_WIN, BLUE_WIN, DRAW = 0, 1, 2
+
+SNAPSHOT_MAGIC = b"MEMS"
+SNAPSHOT_VERSION = 1
+# magic, version, fighters, week, bouts, seed, bouts_per_card, active_share
+_HEADER = struct.Struct("<4sHIIIqId")
+# records/history are stored as 4-byte unsigned ints whatever the platform's "I" size
+_U32 = next(t for t in "IL" if array(t).itemsize == 4)
+
+
+@dataclass(slots=True, frozen=True)
+class Bout:
+    week: int
+    red: int  # fighter id
+    blue: int
+    result: int  # RED_WIN / BLUE_WIN / DRAW
+
+
+# ------------------------------ Worker side ------------------------------ #
+def _row_boxer(row: Sequence[int], name: str) -> Boxer:
+    return Boxer(*row, name=name)
+
+
+def run_card(card: List[Tuple[bytes, bytes, int]]) -> List[int]:
+    """Simulate one card of (red_row, blue_row, seed) bouts; returns result codes."""
+    out = []
+    for red_row, blue_row, seed in card:
+        fight = MatchEngine(_row_boxer(red_row, "Red"), _row_boxer(blue_row, "Blue"), seed=seed).simulate()
+        winner = fight["winner"]
+        out.append(RED_WIN if winner == "Red" else BLUE_WIN if winner == "Blue" else DRAW)
+        report(**fight_counts(fight))
+    flush()
+    return out
+
+
+def _to_le(arr: array) -> array:
+    """Snapshots are little-endian regardless of host byte order."""
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+# --------------------------------- Season -------------------------------- #
+class Season:
+    """Schedules weekly cards from a roster, simulates them and keeps records.
+
+    Each week `active_share` of the roster is drawn, paired with fighters of a
+    similar overall level, and split into cards of `bouts_per_card` bouts.
+    Bout seeds derive from (seed, week) only, so results do not depend on how
+    many worker processes simulate the cards.
+    """
+
+    def __init__(
+        self,
+        roster: Iterable[Boxer] = (),
+        *,
+        seed: int = 0,
+        bouts_per_card: int = BOUTS_PER_CARD,
+        active_share: float = 1.0,
+    ):
+        if bouts_per_card < 1:
+            raise ValueError(f"bouts_per_card must be >= 1, got {bouts_per_card}")
+        if not 0.0 < active_share <= 1.0:
+            raise ValueError(f"active_share must be in (0, 1], got {active_share}")
+        self.seed = seed
+        self.bouts_per_card = bouts_per_card
+        self.active_share = active_share
+        self.week = 0
+        self._ratings = bytearray()
+        self._names: List[str] = []
+        self._records = array(_U32)  # wins, losses, draws per fighter
+        self._history = array(_U32)  # week, red, blue, result per bout
+        self._cache: dict[int, Boxer] = {}
+        for b in roster:
+            self.add_fighter(b)
+
+    # ------------------------------- Roster -------------------------------- #
+    @property
+    def year(self) -> int:
+        return self.week // WEEKS_PER_YEAR
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def _check_name(name: str) -> None:
+        if "\0" in name:  # snapshots separate names with NUL
+            raise ValueError(f"Fighter name {name!r} contains a NUL character")
+
+    def add_fighter(self, boxer: Boxer) -> int:
+        """Append a fighter with a clean record; returns its id."""
+        self._check_name(boxer.name)
+        self._ratings += bytes(boxer.ratings())
+        self._names.append(boxer.name)
+        self._records.extend((0, 0, 0))
+        return len(self._names) - 1
+
+    def replace_fighter(self, fid: int, boxer: Boxer) -> None:
+        """Swap in new ratings for a fighter (e.g. after training); record is kept."""
+        self._check_name(boxer.name)
+        self._ratings[fid * N_RATINGS:(fid + 1) * N_RATINGS] = bytes(boxer.ratings())
+        self._names[fid] = boxer.name
+        self._cache.pop(fid, None)
+
+    def ratings_row(self, fid: int) -> bytes:
+        return bytes(self._ratings[fid * N_RATINGS:(fid + 1) * N_RATINGS])
+
+    def fighter(self, fid: int) -> Boxer:
+        b = self._cache.get(fid)
+        if b is None:
+            b = self._cache[fid] = _row_boxer(self.ratings_row(fid), self._names[fid])
+        return b
+
+    # ------------------------------- Records ------------------------------- #
+    def record(self, fid: int) -> Tuple[int, int, int]:
+        """(wins, losses, draws) for one fighter."""
+        return tuple(self._records[fid * 3:fid * 3 + 3])
+
+    def standings(self, top: int | None = None) -> List[Tuple[int, int, int, int]]:
+        """(fid, wins, losses, draws), best first: most wins, then fewest losses."""
+        r = self._records
+        rows = [(fid, r[fid * 3], r[fid * 3 + 1], r[fid * 3 + 2]) for fid in range(len(self))]
+        rows.sort(key=lambda x: (-x[1], x[2], x[0]))
+        return rows[:top] if top is not None else rows
+
+    @property
+    def bouts(self) -> List[Bout]:
+        h = self._history
+        return [Bout(*h[i:i + 4]) for i in range(0, len(h), 4)]
+
+    def _apply(self, week: int, red: int, blue: int, result: int) -> None:
+        r = self._records
+        if result == RED_WIN:
+            r[red * 3] += 1
+            r[blue * 3 + 1] += 1
+        elif result == BLUE_WIN:
+            r[blue * 3] += 1
+            r[red * 3 + 1] += 1
+        else:
+            r[red * 3 + 2] += 1
+            r[blue * 3 + 2] += 1
+        self._history.extend((week, red, blue, result))
+
+    # ------------------------------ Schedule ------------------------------- #
+    def _week_rng(self, week: int, stream: str) -> random.Random:
+        return random.Random(f"{self.seed}:{week}:{stream}")
+
+    def schedule_week(self, week: int | None = None) -> List[List[Tuple[int, int]]]:
+        """Cards of (red_id, blue_id) pairs for a week (defaults to the next one)."""
+        week = self.week if week is None else week
+        rng = self._week_rng(week, "schedule")
+        n = len(self)
+        active = rng.sample(range(n), int(n * self.active_share))
+        # matchmaking: sort by overall level with a little noise, pair neighbours
+        level = {fid: sum(self._ratings[fid * N_RATINGS:(fid + 1) * N_RATINGS]) + rng.uniform(-11, 11)
+                 for fid in active}
+        active.sort(key=level.__getitem__)
+        pairs = [(active[i], active[i + 1]) if rng.random() < 0.5 else (active[i + 1], active[i])
+                 for i in range(0, len(active) - 1, 2)]
+        rng.shuffle(pairs)
+        k = self.bouts_per_card
+        return [pairs[i:i + k] for i in range(0, len(pairs), k)]
+
+    # ------------------------------ Simulate ------------------------------- #
+    def simulate_week(self, executor: Executor | None = None) -> List[Bout]:
+        """Schedule and simulate the next week's cards (in parallel if given an executor)."""
+        week = self.week
+        cards = self.schedule_week(week)
+        rng = self._week_rng(week, "bouts")
+        jobs = [
+            [(self.ratings_row(r), self.ratings_row(b), rng.getrandbits(32)) for r, b in card]
+            for card in cards
+        ]
+        results = executor.map(run_card, jobs) if executor else map(run_card, jobs)
+        played = []
+        for card, codes in zip(cards, results):
+            for (red, blue), code in zip(card, codes):
+                self._apply(week, red, blue, code)
+                played.append(Bout(week, red, blue, code))
+        self.week += 1
+        return played
+
+    def run(self, weeks: int, *, workers: int | None = None, dashboard: bool = False) -> None:
+        """Simulate `weeks` weeks; workers=1 keeps everything in-process.
+
+        dashboard=True shows live progress (see boxing.dashboard).
+        """
+        if not dashboard:
+            self._run(weeks, workers, None)
+            return
+        total = weeks * (int(len(self) * self.active_share) // 2)
+        with LiveDashboard(f"Season from week {self.week}", total=total) as dash:
+            self._run(weeks, workers, dash)
+
+    def _run(self, weeks: int, workers: int | None, dash: LiveDashboard | None) -> None:
+        if workers == 1:
+            if dash:
+                dash.attach_local()
+            for _ in range(weeks):
+                self.simulate_week()
+            return
+        with dash.pool(workers) if dash else ProcessPoolExecutor(workers) as pool:
+            for _ in range(weeks):
+                self.simulate_week(pool)
+
+    # ------------------------------ Snapshots ------------------------------ #
+    def save(self, path: str) -> None:
+        """Write a compact little-endian binary snapshot."""
+        names = "\0".join(self._names).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(self), self.week, len(self._history) // 4,
+                self.seed, self.bouts_per_card, self.active_share,
+            ))
+            f.write(self._ratings)
+            _to_le(self._records).tofile(f)
+            _to_le(self._history).tofile(f)
+            f.write(struct.pack("<I", len(names)))
+            f.write(names)
+
+    @classmethod
+    def load(cls, path: str) -> "Season":
+        with open(path, "rb") as f:
+            data = f.read()
+
+        def need(pos: int, size: int) -> None:
+            if len(data) < pos + size:
+                raise ValueError(f"{path} is truncated")
+
+        need(0, _HEADER.size)
+        magic, version, n, week, n_bouts, seed, per_card, share = _HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a v{SNAPSHOT_VERSION} season snapshot")
+        season = cls(seed=seed, bouts_per_card=per_card, active_share=share)
+        season.week = week
+        pos = _HEADER.size
+        need(pos, n * N_RATINGS)
+        season._ratings = bytearray(data[pos:pos + n * N_RATINGS])
+        pos += n * N_RATINGS
+        for arr, count in ((season._records, n * 3), (season._history, n_bouts * 4)):
+            size = count * arr.itemsize
+            need(pos, size)
+            arr.frombytes(data[pos:pos + size])
+            pos += size
+            if sys.byteorder == "big":
+                arr.byteswap()
+        need(pos, 4)
+        (name_len,) = struct.unpack_from("<I", data, pos)
+        pos += 4
+        need(pos, name_len)
+        season._names = data[pos:pos + name_len].decode("utf-8").split("\0") if n else []
+        if len(season._names) != n:
+            raise ValueError(f"{path} is corrupt: {len(season._names)} names for {n} fighters")
+        return season
@@ -0,0 +1,392 @@
+# boxing/service.py
+"""Local asyncio simulation service with micro-batching.
+
+Wire protocol: one JSON object per line in both directions.
+
+    {"id": 1, "op": "fight", "red": [22 ints], "blue": [22 ints], "seed": 42}
+    {"id": 2, "op": "odds",  "red": [...], "blue": [...], "fights": 200, "seed": 0}
+    {"id": 3, "op": "stats"}
+
+Ratings rows follow RATING_FIELDS and hold integers 1..20; odds requests
+take at most MAX_ODDS_FIGHTS fights. Replies echo "id" and carry either
+"result" or "error". Fight/odds requests arriving within a short window are
+grouped into one batch, which is split evenly across a pool of warm worker
+processes.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Tuple
+
+from boxing.engine import MatchEngine
+from boxing.models import RATING_FIELDS, SKILL_MAX, SKILL_MIN, Boxer
+from boxing.odds import ODDS_FIGHTS, estimate_odds
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+BATCH_WINDOW = 0.005  # seconds to wait for more requests before dispatching
+MAX_BATCH = 64
+MAX_ODDS_FIGHTS = 100_000  # per odds request; keeps one request from pinning a worker
+STREAM_LIMIT = 1 << 20  # max bytes per request line
+
+
+class ServiceError(RuntimeError):
+    """A request the service rejected or failed to run."""
+
+
+# ------------------------------ Worker side ------------------------------ #
+def boxer_from_row(row: List[int], name: str) -> Boxer:
+    """Build a Boxer from a 22-int ratings row (RATING_FIELDS order)."""
+    if len(row) != len(RATING_FIELDS):
+        raise ValueError(f"Ratings row needs {len(RATING_FIELDS)} values, got {len(row)}")
+    bad = [v for v in row if type(v) is not int or not SKILL_MIN <= v <= SKILL_MAX]
+    if bad:
+        raise ValueError(f"Ratings must be integers in {SKILL_MIN}..{SKILL_MAX}, got {bad[0]!r}")
+    return Boxer(name=name, **dict(zip(RATING_FIELDS, row)))
+
+
+def _warm_worker() -> None:
+    """Pool initializer: pay imports and first-call costs before real work."""
+    row = [10] * len(RATING_FIELDS)
+    MatchEngine(boxer_from_row(row, "Red"), boxer_from_row(row, "Blue"), seed=0).simulate()
+
+
+def _noop() -> None:
+    return None
+
+
+def _run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    op = job.get("op")
+    if op not in ("fight", "odds"):
+        raise ValueError(f"Unknown op {op!r}")
+    red = boxer_from_row(job["red"], "Red")
+    blue = boxer_from_row(job["blue"], "Blue")
+    if op == "fight":
+        fight = MatchEngine(red, blue, seed=job.get("seed")).simulate()
+        winner = fight["winner"]
+        return {
+            "winner": winner.lower() if winner else None,
+            "scores": {"red": fight["scores"]["Red"], "blue": fight["scores"]["Blue"]},
+        }
+    fights = job.get("fights", ODDS_FIGHTS)
+    if type(fights) is not int or not 1 <= fights <= MAX_ODDS_FIGHTS:
+        raise ValueError(f"fights must be an integer in 1..{MAX_ODDS_FIGHTS}, got {fights!r}")
+    return estimate_odds(red, blue, fights=fights, seed=job.get("seed", 0))
+
+
+def run_batch(jobs: List[Dict[str, Any]]) -> List[Tuple[bool, Any]]:
+    """Run one micro-batch in a worker; returns (ok, result-or-error) per job."""
+    out: List[Tuple[bool, Any]] = []
+    for job in jobs:
+        try:
+            out.append((True, _run_job(job)))
+        except Exception as exc:  # one bad job must not take down its batch
+            out.append((False, f"{type(exc).__name__}: {exc}"))
+    return out
+
+
+# -------------------------------- Metrics -------------------------------- #
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    return sorted_vals[round(q * (len(sorted_vals) - 1))]
+
+
+class ServiceMetrics:
+    """Request latency and throughput counters (latency kept for the last `window` requests)."""
+
+    def __init__(self, window: int = 10_000):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_jobs = 0
+        self.latencies: deque[float] = deque(maxlen=window)
+
+    def record_batch(self, size: int) -> None:
+        self.batches += 1
+        self.batched_jobs += size
+
+    def record_request(self, latency: float, ok: bool) -> None:
+        self.requests += 1
+        self.errors += not ok
+        self.latencies.append(latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = time.perf_counter() - self.started
+        lat = sorted(self.latencies)
+        return {
+            "uptime_s": uptime,
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput_rps": self.requests / uptime if uptime else 0.0,
+            "batches": self.batches,
+            "mean_batch": self.batched_jobs / self.batches if self.batches else 0.0,
+            "latency_ms": {
+                "p50": _percentile(lat, 0.50) * 1000,
+                "p95": _percentile(lat, 0.95) * 1000,
+                "p99": _percentile(lat, 0.99) * 1000,
+                "max": (lat[-1] if lat else 0.0) * 1000,
+            },
+        }
+
+
+# -------------------------------- Server --------------------------------- #
+class SimulationService:
+    """Micro-batching front end over a pool of warm MatchEngine workers."""
+
+    def __init__(self, *, workers: int | None = None, window: float = BATCH_WINDOW, max_batch: int = MAX_BATCH):
+        self.workers = workers or os.cpu_count() or 1
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = ServiceMetrics()
+        self._pool: ProcessPoolExecutor | None = None
+        self._queue: asyncio.Queue | None = None
+        self._batcher: asyncio.Task | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    # ------------------------------ Lifecycle ------------------------------ #
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, *, path: str | None = None) -> None:
+        """Warm the worker pool and start listening (Unix socket if `path` is given)."""
+        loop = asyncio.get_running_loop()
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_warm_worker)
+        # one no-op per worker forces every process to spawn and warm up now
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _noop) for _ in range(self.workers)))
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle, path=path, limit=STREAM_LIMIT)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=STREAM_LIMIT)
+
+    @property
+    def address(self) -> Any:
+        """Bound socket address: (host, port) for TCP, a path for Unix sockets."""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server:
+            self._server.close()
+            # wait_closed() waits for every connection, so drop the clients first
+            for writer in self._writers:
+                writer.close()
+            await self._server.wait_closed()
+        if self._batcher:
+            self._batcher.cancel()
+        while self._queue and not self._queue.empty():
+            self._fail([self._queue.get_nowait()], "service shutting down")
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        if self._pool:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> "SimulationService":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # ------------------------------ Requests ------------------------------- #
+    async def submit(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue one fight/odds job for the next micro-batch and await its result."""
+        t0 = time.perf_counter()
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((job, fut))
+        try:
+            result = await fut
+        except ServiceError:
+            self.metrics.record_request(time.perf_counter() - t0, ok=False)
+            raise
+        self.metrics.record_request(time.perf_counter() - t0, ok=True)
+        return result
+
+    async def _batch_loop(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self.max_batch - 1:
+                try:
+                    await asyncio.sleep(self.window)  # let the batch fill up
+                except asyncio.CancelledError:
+                    self._fail(batch, "service shutting down")
+                    raise
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    @staticmethod
+    def _fail(items: List[Tuple[Dict[str, Any], asyncio.Future]], error: str) -> None:
+        for _, fut in items:
+            if not fut.done():
+                fut.set_exception(ServiceError(error))
+
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        self.metrics.record_batch(len(batch))
+        # split the batch so every warm worker takes a share instead of one running it all
+        size = -(-len(batch) // self.workers)
+        await asyncio.gather(*(self._run_chunk(batch[i:i + size]) for i in range(0, len(batch), size)))
+
+    async def _run_chunk(self, chunk: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._pool, run_batch, [job for job, _ in chunk])
+        except BrokenProcessPool as exc:
+            results = [(False, f"worker pool failed: {exc}")] * len(chunk)
+        except Exception as exc:  # anything else still has to answer every request
+            results = [(False, f"worker failed: {type(exc).__name__}: {exc}")] * len(chunk)
+        for (_, fut), (ok, value) in zip(chunk, results):
+            if fut.done():  # requester went away
+                continue
+            if ok:
+                fut.set_result(value)
+            else:
+                fut.set_exception(ServiceError(value))
+
+    async def _answer(self, msg: Dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        reply: Dict[str, Any] = {"id": msg.get("id")}
+        try:
+            if msg.get("op") == "stats":
+                reply["result"] = self.metrics.snapshot()
+            else:
+                reply["result"] = await self.submit(msg)
+        except ServiceError as exc:
+            reply["error"] = str(exc)
+        if not writer.is_closing():
+            writer.write(json.dumps(reply).encode() + b"\n")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks: set[asyncio.Task] = set()
+        self._writers.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    msg = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    writer.write(json.dumps({"id": None, "error": f"bad JSON: {exc}"}).encode() + b"\n")
+                    continue
+                if not isinstance(msg, dict):
+                    error = f"request must be a JSON object, got {type(msg).__name__}"
+                    writer.write(json.dumps({"id": None, "error": error}).encode() + b"\n")
+                    continue
+                # answer concurrently so one client can pipeline many requests
+                task = asyncio.create_task(self._answer(msg, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+# -------------------------------- Client --------------------------------- #
+class SimulationClient:
+    """Pipelining client: many requests may be in flight on one connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader, self._writer = reader, writer
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, *, path: str | None = None) -> "SimulationClient":
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path, limit=STREAM_LIMIT)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=STREAM_LIMIT)
+        return cls(reader, writer)
+
+    async def _read_loop(self) -> None:
+        try:
+            while line := await self._reader.readline():
+                reply = json.loads(line)
+                fut = self._pending.pop(reply.get("id"), None)
+                if fut is None or fut.done():
+                    continue
+                if "error" in reply:
+                    fut.set_exception(ServiceError(reply["error"]))
+                else:
+                    fut.set_result(reply["result"])
+        finally:
+            for fut in self._pending.values():
+                if not fut.done():
+                    fut.set_exception(ServiceError("connection closed"))
+            self._pending.clear()
+
+    async def request(self, op: str, **payload: Any) -> Dict[str, Any]:
+        self._next_id += 1
+        rid = self._next_id
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[rid] = fut
+        self._writer.write(json.dumps({"id": rid, "op": op, **payload}).encode() + b"\n")
+        await self._writer.drain()
+        return await fut
+
+    async def fight(self, red: Boxer, blue: Boxer, *, seed: int | None = None) -> Dict[str, Any]:
+        return await self.request("fight", red=red.ratings(), blue=blue.ratings(), seed=seed)
+
+    async def odds(self, red: Boxer, blue: Boxer, *, fights: int = ODDS_FIGHTS, seed: int = 0) -> Dict[str, float]:
+        return await self.request("odds", red=red.ratings(), blue=blue.ratings(), fights=fights, seed=seed)
+
+    async def stats(self) -> Dict[str, Any]:
+        return await self.request("stats")
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._reader_task
+
+    async def __aenter__(self) -> "SimulationClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+# --------------------------------- Main ---------------------------------- #
+async def _serve(args: argparse.Namespace) -> None:
+    service = SimulationService(workers=args.workers, window=args.window_ms / 1000, max_batch=args.max_batch)
+    async with service:
+        await service.start(args.host, args.port, path=args.unix)
+        print(f"Serving on {service.address} with {service.workers} workers")
+        await service.serve_forever()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run the local micro-batching simulation service.")
+    ap.add_argument("--host", default=DEFAULT_HOST, help="TCP host (localhost only by default)")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    ap.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    ap.add_argument("--window-ms", type=float, default=BATCH_WINDOW * 1000, help="Micro-batch window")
+    ap.add_argument("--max-batch", type=int, default=MAX_BATCH, help="Max requests per batch")
+    args = ap.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Load generator for boxing.service: many concurrent clients, mixed fight/odds traffic."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from boxing.models import RATING_FIELDS, Boxer
+from boxing.service import DEFAULT_HOST, DEFAULT_PORT, SimulationClient, SimulationService
+
+
+def random_boxer(rng: random.Random, name: str) -> Boxer:
+    base = rng.randint(4, 16)
+    return Boxer(name=name, **{k: max(1, min(20, base + rng.randint(-3, 3))) for k in RATING_FIELDS})
+
+
+async def client_worker(args, n_requests: int, seed: int, latencies: list[float]) -> None:
+    rng = random.Random(seed)
+    async with await SimulationClient.connect(args.host, args.port, path=args.unix) as client:
+        for _ in range(n_requests):
+            red, blue = random_boxer(rng, "Red"), random_boxer(rng, "Blue")
+            t0 = time.perf_counter()
+            if rng.random() < args.odds_share:
+                await client.odds(red, blue, fights=args.odds_fights, seed=rng.randrange(1 << 30))
+            else:
+                await client.fight(red, blue, seed=rng.randrange(1 << 30))
+            latencies.append(time.perf_counter() - t0)
+
+
+async def run(args) -> None:
+    service = None
+    if args.spawn:
+        service = SimulationService(workers=args.workers, window=args.window_ms / 1000)
+        await service.start(args.host, args.port, path=args.unix)
+        if not args.unix:
+            args.host, args.port = service.address[:2]
+
+    latencies: list[float] = []
+    per_client = [args.requests // args.clients + (i < args.requests % args.clients) for i in range(args.clients)]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client_worker(args, n, args.seed + i, latencies) for i, n in enumerate(per_client)))
+    elapsed = time.perf_counter() - t0
+
+    lat = sorted(latencies)
+    print(f"Requests:   {len(lat)} in {elapsed:.2f}s ({len(lat) / elapsed:.1f} req/s)")
+    print(f"Latency ms: p50={lat[len(lat) // 2] * 1000:.1f} "
+          f"p95={lat[int(0.95 * (len(lat) - 1))] * 1000:.1f} "
+          f"mean={statistics.mean(lat) * 1000:.1f} max={lat[-1] * 1000:.1f}")
+
+    async with await SimulationClient.connect(args.host, args.port, path=args.unix) as client:
+        stats = await client.stats()
+    print(f"Server:     {stats['requests']} requests, {stats['batches']} batches "
+          f"(mean size {stats['mean_batch']:.1f}), p95 {stats['latency_ms']['p95']:.1f} ms")
+
+    if service:
+        await service.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Generate load against the simulation service.")
+    ap.add_argument("--host", default=DEFAULT_HOST)
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--unix", metavar="PATH", help="Connect to a Unix socket instead of TCP")
+    ap.add_argument("--clients", type=int, default=32, help="Concurrent client connections")
+    ap.add_argument("--requests", type=int, default=2000, help="Total requests")
+    ap.add_argument("--odds-share", type=float, default=0.1, help="Fraction of requests that are odds queries")
+    ap.add_argument("--odds-fights", type=int, default=50, help="Fights per odds query")
+    ap.add_argument("--seed", type=int, default=0, help="Traffic seed")
+    ap.add_argument("--spawn", action="store_true", help="Start an in-process service for the run")
+    ap.add_argument("--workers", type=int, default=None, help="Workers for --spawn")
+    ap.add_argument("--window-ms", type=float, default=5.0, help="Batch window for --spawn")
+    args = ap.parse_args()
+    if args.spawn and not args.unix:
+        args.port = 0  # pick a free port
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
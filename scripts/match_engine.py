@@ -1,15 +1,23 @@
 # scripts/match_engine.py
 from __future__ import annotations
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from boxing.engine import MatchEngine
+from boxing.backends import DEFAULT_ENGINE, engine_names, get_engine
 from boxing.models import Boxer
+from boxing.odds import estimate_odds, quick_odds
 
 ROUNDS = 12
 ROUND_COLS = [f"Round{i}" for i in range(1, ROUNDS + 1)] + ["Total"]
 
+HEAT_MAX = 20       # bases 1..HEAT_MAX on both axes
+HEAT_CELL = 28      # pixels
+REFINE_STEP = 40    # simulated fights added to a cell per refinement pass
+REFINE_TARGET = 400  # fights per cell before refinement stops
+
 
 # ------------------------------ Boxer helpers ------------------------------ #
 def make_boxer(name: str, base: int) -> Boxer:
@@ -28,15 +36,146 @@ def make_boxer(name: str, base: int) -> Boxer:
     return Boxer(name=name, **fields)
 
 
-def round_points(rsum: dict) -> tuple[int, int]:
-    """Compute 10-Point-Must points for one round from telemetry (landed counts)."""
-    red_landed = sum(rsum["red"]["landed"].values())
-    blue_landed = sum(rsum["blue"]["landed"].values())
-    if red_landed > blue_landed:
-        return 10, 9
-    if blue_landed > red_landed:
-        return 9, 10
-    return 10, 10
+# ------------------------------ Heatmap odds ------------------------------ #
+class OddsCache:
+    """Simulated (red wins, blue wins, draws, fights) per (red base, blue base).
+
+    Shared by every heatmap window, so reopening the view picks up where the
+    last refinement stopped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cells: dict[tuple[int, int], list[int]] = {}
+
+    def fights(self, key: tuple[int, int]) -> int:
+        with self._lock:
+            return self._cells.get(key, [0, 0, 0, 0])[3]
+
+    def add(self, key: tuple[int, int], odds: dict[str, float], fights: int) -> None:
+        with self._lock:
+            cell = self._cells.setdefault(key, [0, 0, 0, 0])
+            cell[0] += round(odds["red"] * fights)
+            cell[1] += round(odds["blue"] * fights)
+            cell[2] += round(odds["draw"] * fights)
+            cell[3] += fights
+
+    def odds(self, key: tuple[int, int]) -> dict[str, float] | None:
+        with self._lock:
+            cell = self._cells.get(key)
+        if not cell or not cell[3]:
+            return None
+        return {"red": cell[0] / cell[3], "blue": cell[1] / cell[3], "draw": cell[2] / cell[3]}
+
+
+ODDS_CACHE = OddsCache()
+
+
+class HeatmapRefiner(threading.Thread):
+    """Background worker: sweeps every cell in passes of REFINE_STEP simulated
+    fights and reports each refined cell on `updates`."""
+
+    def __init__(self, cache: OddsCache, updates: queue.Queue):
+        super().__init__(daemon=True)
+        self.cache, self.updates = cache, updates
+        self.stop = threading.Event()
+
+    def run(self):
+        cells = [(r, b) for r in range(1, HEAT_MAX + 1) for b in range(1, HEAT_MAX + 1)]
+        while not self.stop.is_set():
+            todo = [c for c in cells if self.cache.fights(c) < REFINE_TARGET]
+            if not todo:
+                break
+            for key in todo:
+                if self.stop.is_set():
+                    return
+                done = self.cache.fights(key)
+                red, blue = make_boxer("Red", key[0]), make_boxer("Blue", key[1])
+                # seeds continue from earlier passes, so each pass adds fresh fights
+                self.cache.add(key, estimate_odds(red, blue, fights=REFINE_STEP, seed=done), REFINE_STEP)
+                self.updates.put(key)
+
+
+def heat_colour(odds: dict[str, float]) -> str:
+    """Blue (Blue favoured) → white (even) → red (Red favoured)."""
+    edge = max(-1.0, min(1.0, odds["red"] - odds["blue"]))
+    fade = int(255 * (1 - abs(edge)))
+    return f"#ff{fade:02x}{fade:02x}" if edge >= 0 else f"#{fade:02x}{fade:02x}ff"
+
+
+class HeatmapWindow(tk.Toplevel):
+    """Red-win probability for every (red base, blue base) pair.
+
+    Cells start from the closed-form quick_odds estimate and are replaced by
+    simulated odds as the background refiner works through them. Clicking a
+    cell loads that matchup into the main scoreboard.
+    """
+
+    def __init__(self, app: "MatchEngineApp"):
+        super().__init__(app)
+        self.app = app
+        self.title("Win probability — Red base (rows) vs Blue base (columns)")
+        self.resizable(False, False)
+
+        size = HEAT_CELL * (HEAT_MAX + 1)
+        self.canvas = tk.Canvas(self, width=size, height=size, highlightthickness=0)
+        self.canvas.pack(padx=10, pady=(10, 4))
+        self.status = ttk.Label(self, text="", anchor="w")
+        self.status.pack(fill="x", padx=10, pady=(0, 10))
+
+        self._draw_grid()
+        self.updates: queue.Queue = queue.Queue()
+        self.refiner = HeatmapRefiner(ODDS_CACHE, self.updates)
+        self.refiner.start()
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._poll_id = self.after(50, self._poll)
+
+    def _draw_grid(self):
+        c = HEAT_CELL
+        for i in range(1, HEAT_MAX + 1):
+            self.canvas.create_text(c * i + c / 2, c / 2, text=str(i), font=("Segoe UI", 8, "bold"))
+            self.canvas.create_text(c / 2, c * i + c / 2, text=str(i), font=("Segoe UI", 8, "bold"))
+        self.cells: dict[tuple[int, int], tuple[int, int]] = {}
+        for r in range(1, HEAT_MAX + 1):
+            for b in range(1, HEAT_MAX + 1):
+                x, y = c * b, c * r
+                rect = self.canvas.create_rectangle(x, y, x + c, y + c, outline="#999999")
+                label = self.canvas.create_text(x + c / 2, y + c / 2, font=("Segoe UI", 7))
+                self.cells[(r, b)] = (rect, label)
+                self._paint((r, b))
+
+    def _paint(self, key: tuple[int, int]):
+        odds = ODDS_CACHE.odds(key) or quick_odds(make_boxer("Red", key[0]), make_boxer("Blue", key[1]))
+        rect, label = self.cells[key]
+        self.canvas.itemconfigure(rect, fill=heat_colour(odds))
+        self.canvas.itemconfigure(label, text=f"{odds['red'] * 100:.0f}")
+
+    def _poll(self):
+        try:
+            while True:
+                self._paint(self.updates.get_nowait())
+        except queue.Empty:
+            pass
+        refined = sum(ODDS_CACHE.fights(k) >= REFINE_TARGET for k in self.cells)
+        self.status.config(
+            text=f"Red win % — refined {refined}/{len(self.cells)} cells "
+                 f"to {REFINE_TARGET} fights. Click a cell to load it."
+        )
+        self._poll_id = self.after(100, self._poll)
+
+    def _on_click(self, event):
+        r, b = int(event.y // HEAT_CELL), int(event.x // HEAT_CELL)
+        if (r, b) not in self.cells:
+            return
+        self.app.red_base.set(r)
+        self.app.blue_base.set(b)
+        self.app.run_sim()
+
+    def _on_close(self):
+        self.refiner.stop.set()
+        self.after_cancel(self._poll_id)
+        self.destroy()
 
 
 # ---------------------------------- GUI ----------------------------------- #
@@ -58,7 +197,7 @@ class MatchEngineApp(ttk.Frame):
     def _build_controls(self):
         frm = ttk.Frame(self)
         frm.grid(row=0, column=0, sticky="ew", pady=(0, 10))
-        frm.columnconfigure(6, weight=1)  # spacer
+        frm.columnconfigure(6, weight=1)  # spacer (engine label hugs its right edge)
 
         ttk.Label(frm, text="Seed").grid(row=0, column=0, padx=(0, 6))
         self.seed_var = tk.IntVar(value=42)
@@ -72,12 +211,19 @@ class MatchEngineApp(ttk.Frame):
         self.blue_base = tk.IntVar(value=12)
         ttk.Entry(frm, textvariable=self.blue_base, width=6).grid(row=0, column=5, padx=(0, 12))
 
-        ttk.Button(frm, text="Simulate", command=self.run_sim).grid(row=0, column=7, padx=(6, 0))
-        ttk.Button(frm, text="Transcript…", command=self.show_transcript).grid(row=0, column=8, padx=(12, 0))
+        ttk.Label(frm, text="Engine").grid(row=0, column=6, padx=(0, 6), sticky="e")
+        self.engine_var = tk.StringVar(value=DEFAULT_ENGINE)
+        ttk.Combobox(frm, textvariable=self.engine_var, values=engine_names(), state="readonly", width=10).grid(
+            row=0, column=7, padx=(0, 12)
+        )
+
+        ttk.Button(frm, text="Simulate", command=self.run_sim).grid(row=0, column=8, padx=(6, 0))
+        ttk.Button(frm, text="Transcript…", command=self.show_transcript).grid(row=0, column=9, padx=(12, 0))
+        ttk.Button(frm, text="Heatmap…", command=self.show_heatmap).grid(row=0, column=10, padx=(12, 0))
 
         self.result_var = tk.StringVar(value="")
         ttk.Label(frm, textvariable=self.result_var, font=("Segoe UI", 10, "bold")).grid(
-            row=0, column=9, padx=12, sticky="w"
+            row=0, column=11, padx=12, sticky="w"
         )
 
     # ---- Scoreboard table ----
@@ -123,17 +269,14 @@ class MatchEngineApp(ttk.Frame):
         red = make_boxer("Red", rbase)
         blue = make_boxer("Blue", bbase)
 
-        fight = MatchEngine(red, blue, seed=seed).simulate()
+        fight = get_engine(self.engine_var.get()).simulate(red, blue, seed)
         self._populate_scoreboard(fight)
         self._last_fight = fight  # keep for transcript window
 
     def _populate_scoreboard(self, fight: dict):
-        # collect per-round points
-        red_pts, blue_pts = [], []
-        for r in fight["rounds"]:
-            rp, bp = round_points(r)
-            red_pts.append(rp)
-            blue_pts.append(bp)
+        # per-round points (every engine backend reports them)
+        red_pts = [rp for rp, _ in fight["round_points"]]
+        blue_pts = [bp for _, bp in fight["round_points"]]
 
         # fill rows
         for i, (rp, bp) in enumerate(zip(red_pts, blue_pts), start=1):
@@ -145,13 +288,25 @@ class MatchEngineApp(ttk.Frame):
         self.tree.set("Blue", "Total", str(sum(blue_pts)))
 
         self.result_var.set(f"Winner: {fight['winner'] or 'Draw'}")
-        self.footer.config(text=f"Scores from engine: {fight['scores']} — seed={self.seed_var.get()}")
+        self.footer.config(
+            text=f"Scores from engine: {fight['scores']} — seed={self.seed_var.get()} — engine={self.engine_var.get()}"
+        )
+
+    def show_heatmap(self):
+        win = getattr(self, "_heatmap", None)
+        if win is not None and win.winfo_exists():
+            win.lift()
+            return
+        self._heatmap = HeatmapWindow(self)
 
     def show_transcript(self):
         fight = getattr(self, "_last_fight", None)
         if not fight:
             messagebox.showinfo("Transcript", "Run a simulation first.")
             return
+        if "events" not in fight:
+            messagebox.showinfo("Transcript", "This engine backend records no transcript.")
+            return
         win = tk.Toplevel(self)
         win.title("Transcript")
         win.geometry("700x420")
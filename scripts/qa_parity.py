@@ -1,13 +1,20 @@
 # scripts/qa_parity.py
 #!/usr/bin/env python
+import argparse
+import json
+import math
 import statistics
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from boxing.engine import MatchEngine
+from boxing.backends import DEFAULT_ENGINE, engine_names, get_engine
+from boxing.dashboard import LiveDashboard, fight_counts, flush, report
 from boxing.models import Boxer
 
 PUNCHES = ("jab", "straight", "lead_hook", "hook", "lead_uppercut", "uppercut")
 TEST_FIGHTS = 1000
+CHUNK_FIGHTS = 250  # fights per worker job
 
 
 def make_boxer(name: str, base: int = 10, **overrides) -> Boxer:
@@ -47,51 +54,84 @@ def analyze(best_set: set[str], rounds: list[dict], side: str) -> tuple[float, f
     return best_share, land_pct
 
 
-def run_parity():
-    # Equal fighters baseline
+def _parity_chunk(seeds: range, engine: str = DEFAULT_ENGINE) -> list[tuple]:
+    """Fight the two base-10 fighters for each seed; one row of telemetry per fight.
+
+    Outcome-only engines leave the four telemetry columns as None.
+    """
+    backend = get_engine(engine)
     red = make_boxer("Red", base=10)
     blue = make_boxer("Blue", base=10)
 
-    wins = Counter()
-    score_diffs = []
-    red_best_share = []
-    blue_best_share = []
-    red_land_pct = []
-    blue_land_pct = []
-
     # compute best-accuracy sets once (same ratings each run)
     red_best = {p for p, v in pacc_table(red).items() if v == max(pacc_table(red).values())}
     blue_best = {p for p, v in pacc_table(blue).items() if v == max(pacc_table(blue).values())}
 
-    for seed in range(TEST_FIGHTS):
-        fight = MatchEngine(red, blue, seed=seed).simulate()
-        score_diffs.append(fight["scores"]["Red"] - fight["scores"]["Blue"])
-        if fight["winner"]:
-            wins[fight["winner"]] += 1
+    rows = []
+    for fight in backend.simulate_many(red, blue, seeds):
+        report(**fight_counts(fight))
 
         # telemetry-based punch selection & accuracy checks
-        rb, rl = analyze(red_best, fight["rounds"], "red")
-        bb, bl = analyze(blue_best, fight["rounds"], "blue")
-        red_best_share.append(rb); red_land_pct.append(rl)
-        blue_best_share.append(bb); blue_land_pct.append(bl)
+        rb = rl = bb = bl = None
+        if backend.telemetry:
+            rb, rl = analyze(red_best, fight["rounds"], "red")
+            bb, bl = analyze(blue_best, fight["rounds"], "blue")
+        diff = fight["scores"]["Red"] - fight["scores"]["Blue"]
+        rows.append((fight["winner"], diff, rb, rl, bb, bl))
+    flush()
+    return rows
+
+
+def _run_chunks(chunks: list[range], workers: int, dash: LiveDashboard | None, engine: str) -> list[tuple]:
+    job = partial(_parity_chunk, engine=engine)
+    if workers == 1:
+        if dash:
+            dash.attach_local()
+        return [row for chunk in chunks for row in job(chunk)]
+    pool = dash.pool(workers) if dash else ProcessPoolExecutor(workers)
+    with pool:
+        return [row for rows in pool.map(job, chunks) for row in rows]
+
+
+def run_parity(
+    fights: int = TEST_FIGHTS, *, workers: int = 1, dashboard: bool = False, engine: str = DEFAULT_ENGINE
+):
+    chunk = max(1, min(CHUNK_FIGHTS, fights // max(1, workers)))
+    chunks = [range(s, min(s + chunk, fights)) for s in range(0, fights, chunk)]
+    if dashboard:
+        with LiveDashboard("QA parity — base 10 mirror", total=fights) as dash:
+            rows = _run_chunks(chunks, workers, dash, engine)
+    else:
+        rows = _run_chunks(chunks, workers, None, engine)
 
-    draws = TEST_FIGHTS - wins.total()
+    wins = Counter(w for w, *_ in rows if w)
+    score_diffs = [r[1] for r in rows]
+    red_best_share = [r[2] for r in rows]
+    red_land_pct = [r[3] for r in rows]
+    blue_best_share = [r[4] for r in rows]
+    blue_land_pct = [r[5] for r in rows]
+
+    draws = fights - wins.total()
     print(f"Red wins:  {wins['Red']}")
     print(f"Blue wins: {wins['Blue']}")
     print(f"Draws:     {draws}")
     avg_diff = statistics.mean(score_diffs)
     print(f"Average score diff (Red-Blue): {avg_diff:+.2f}")
 
-    # Telemetry summaries (should be very similar for equal fighters)
-    m_red_best = statistics.mean(red_best_share)
-    m_blue_best = statistics.mean(blue_best_share)
-    m_red_land = statistics.mean(red_land_pct)
-    m_blue_land = statistics.mean(blue_land_pct)
+    telemetry = red_best_share[0] is not None
+    if telemetry:
+        # Telemetry summaries (should be very similar for equal fighters)
+        m_red_best = statistics.mean(red_best_share)
+        m_blue_best = statistics.mean(blue_best_share)
+        m_red_land = statistics.mean(red_land_pct)
+        m_blue_land = statistics.mean(blue_land_pct)
 
-    print(f"Red best-punch usage:  {m_red_best:.3f}")
-    print(f"Blue best-punch usage: {m_blue_best:.3f}")
-    print(f"Red land% overall:     {m_red_land:.3f}")
-    print(f"Blue land% overall:    {m_blue_land:.3f}")
+        print(f"Red best-punch usage:  {m_red_best:.3f}")
+        print(f"Blue best-punch usage: {m_blue_best:.3f}")
+        print(f"Red land% overall:     {m_red_land:.3f}")
+        print(f"Blue land% overall:    {m_blue_land:.3f}")
+    else:
+        print(f"(engine '{engine}' has no telemetry: land% and punch-usage checks skipped)")
 
     # ---------- Parity thresholds (tune as needed) ----------
     non_draw = wins['Red'] + wins['Blue']
@@ -100,6 +140,9 @@ def run_parity():
         if abs(red_win_rate - 0.5) > 0.035:  # ±3.5% from 50/50
             raise SystemExit(f"FAIL: Win-rate skew {red_win_rate:.3f} > 3.5%")
 
+    if not telemetry:
+        return
+
     if abs(m_red_land - m_blue_land) > 0.015:  # land% within 1.5%
         raise SystemExit(f"FAIL: Land% skew {abs(m_red_land - m_blue_land):.3f} > 1.5%")
 
@@ -107,5 +150,265 @@ def run_parity():
         raise SystemExit(f"FAIL: Best-punch usage skew {abs(m_red_best - m_blue_best):.3f} > 5%")
 
 
+# ---------------------------------------------------------------------------
+# Parity matrix: every base level, mirrored profiles, corner swaps
+# ---------------------------------------------------------------------------
+MATRIX_FIGHTS = 1000  # fights per cell (per corner for swap cells)
+MATRIX_BASES = range(1, 21)
+REPORT_VERSION = 1
+Z_CELL = 3.0  # statistical slack (in standard errors) on top of the fixed thresholds
+
+# Fixed per-cell thresholds; cells may override any of them
+THRESHOLDS = {"win": 0.035, "land": 0.015, "best": 0.05}
+
+# Asymmetric profiles: overrides on top of base 10 (plain base 10 is already base/10)
+PROFILES: dict[str, dict] = {
+    # block and dodge scores tie exactly (0.15) but not as floats
+    "tied_defence": {"blocking": 3, "anticipation": 1, "agility": 3, "reflexes": 4, "composure": 1, "decision": 18},
+    "high_decision": {"decision": 18},
+    "high_blocking": {"blocking": 18},
+    "slick": {"reflexes": 17, "agility": 17, "anticipation": 16},
+    "sharpshooter": {"accuracy": 17, "jab": 16, "straight": 16},
+    "brawler": {"lead_hook": 16, "hook": 17, "uppercut": 16, "decision": 6},
+    "low_iq": {"decision": 3, "composure": 4, "anticipation": 4},
+}
+
+# (profile A, profile B, threshold overrides): A vs B with A in each corner
+SWAP_PAIRS: list[tuple[str, str, dict]] = [
+    ("high_decision", "high_blocking", {}),
+    ("slick", "sharpshooter", {}),
+    ("brawler", "high_blocking", {}),
+    ("low_iq", "tied_defence", {}),
+    ("sharpshooter", "high_decision", {}),
+]
+
+
+def matrix_cells() -> list[dict]:
+    """Catalogue of cells; 'mirror' cells check red vs blue, 'swap' cells check A as red vs A as blue."""
+    cells = [
+        {"id": f"base/{b:02d}", "kind": "mirror", "a": {"base": b}, "b": {"base": b}, "thresholds": {}}
+        for b in MATRIX_BASES
+    ]
+    cells += [
+        {"id": f"profile/{name}", "kind": "mirror", "a": {"overrides": o}, "b": {"overrides": o}, "thresholds": {}}
+        for name, o in PROFILES.items()
+    ]
+    cells += [
+        {"id": f"swap/{a}-vs-{b}", "kind": "swap", "a": {"overrides": PROFILES[a]},
+         "b": {"overrides": PROFILES[b]}, "thresholds": t}
+        for a, b, t in SWAP_PAIRS
+    ]
+    return cells
+
+
+def _spec_boxer(name: str, spec: dict) -> Boxer:
+    return make_boxer(name, spec.get("base", 10), **spec.get("overrides", {}))
+
+
+def _corner_stats(backend, red: Boxer, blue: Boxer, seeds: range) -> dict:
+    """Raw counts for one corner assignment (corners named Red/Blue)."""
+    best = {side: {p for p, v in pacc_table(b).items() if v == max(pacc_table(b).values())}
+            for side, b in (("red", red), ("blue", blue))}
+    out = Counter()
+    for fight in backend.simulate_many(red, blue, seeds):
+        counts = fight_counts(fight)
+        report(**counts)
+        out.update(counts)
+        if backend.telemetry:
+            for side in ("red", "blue"):
+                share, _ = analyze(best[side], fight["rounds"], side)
+                out[f"{side}_best"] += share
+    return dict(out)
+
+
+def _matrix_cell(cell: dict, seeds: range, engine: str) -> dict:
+    backend = get_engine(engine)
+    red, blue = _spec_boxer("Red", cell["a"]), _spec_boxer("Blue", cell["b"])
+    raw = {"a_red": _corner_stats(backend, red, blue, seeds)}
+    if cell["kind"] == "swap":
+        raw["a_blue"] = _corner_stats(backend, _spec_boxer("Red", cell["b"]), _spec_boxer("Blue", cell["a"]), seeds)
+    flush()
+    return raw
+
+
+def _share(hits: float, n: float) -> tuple[float, float]:
+    """(proportion, standard error)."""
+    if not n:
+        return 0.0, 0.0
+    p = hits / n
+    return p, math.sqrt(p * (1 - p) / n)
+
+
+def _side_metrics(c: dict, side: str) -> dict:
+    """Metrics for the fighter in `side` from one corner assignment."""
+    other = "blue" if side == "red" else "red"
+    decided = c.get("red_wins", 0) + c.get("blue_wins", 0)
+    win, win_se = _share(c.get(f"{side}_wins", 0), decided)
+    m = {"win": win, "win_se": win_se, "decided": decided, "fights": c.get("fights", 0)}
+    if c.get(f"{side}_thrown"):
+        m["land"], m["land_se"] = _share(c[f"{side}_landed"], c[f"{side}_thrown"])
+        m["land_opp"], m["land_opp_se"] = _share(c[f"{other}_landed"], c[f"{other}_thrown"])
+    if f"{side}_best" in c:
+        m["best"] = c[f"{side}_best"] / c["fights"]
+        m["best_opp"] = c[f"{other}_best"] / c["fights"]
+    return m
+
+
+def evaluate_cell(cell: dict, raw: dict) -> dict:
+    """Turn raw counts into metrics, per-cell thresholds and pass/fail."""
+    limits = {**THRESHOLDS, **cell["thresholds"]}
+    checks = {}  # metric -> (skew, allowed)
+    if cell["kind"] == "mirror":
+        m = _side_metrics(raw["a_red"], "red")
+        checks["win"] = (m["win"] - 0.5, max(limits["win"], Z_CELL * m["win_se"]))
+        if "land" in m:
+            se = math.hypot(m["land_se"], m["land_opp_se"])
+            checks["land"] = (m["land"] - m["land_opp"], max(limits["land"], Z_CELL * se))
+        if "best" in m:
+            checks["best"] = (m["best"] - m["best_opp"], limits["best"])
+        metrics = {"red": m}
+    else:
+        as_red, as_blue = _side_metrics(raw["a_red"], "red"), _side_metrics(raw["a_blue"], "blue")
+        se = math.hypot(as_red["win_se"], as_blue["win_se"])
+        checks["win"] = (as_red["win"] - as_blue["win"], max(limits["win"], Z_CELL * se))
+        if "land" in as_red:
+            se = math.hypot(as_red["land_se"], as_blue["land_se"])
+            checks["land"] = (as_red["land"] - as_blue["land"], max(limits["land"], Z_CELL * se))
+        if "best" in as_red:
+            checks["best"] = (as_red["best"] - as_blue["best"], limits["best"])
+        metrics = {"a_as_red": as_red, "a_as_blue": as_blue}
+
+    failures = [k for k, (skew, allowed) in checks.items() if abs(skew) > allowed]
+    return {
+        "id": cell["id"],
+        "kind": cell["kind"],
+        "metrics": metrics,
+        "skew": {k: skew for k, (skew, _) in checks.items()},
+        "allowed": {k: allowed for k, (_, allowed) in checks.items()},
+        "pass": not failures,
+        "failures": failures,
+    }
+
+
+BASELINE_KEYS = ("engine", "fights_per_cell", "seed")
+
+
+def compare_reports(current: dict, previous: dict) -> list[str]:
+    """Cells that newly fail, went missing, or whose skew moved by more than the cell's allowance.
+
+    Raises ValueError if the reports were run with a different engine, fight count or seed.
+    """
+    mismatched = [k for k in BASELINE_KEYS if previous.get(k) != current.get(k)]
+    if mismatched:
+        raise ValueError("baseline is not comparable: " + ", ".join(
+            f"{k} {previous.get(k)!r} vs {current.get(k)!r}" for k in mismatched
+        ))
+    before = {c["id"]: c for c in previous.get("cells", [])}
+    now = {c["id"] for c in current["cells"]}
+    problems = [f"{cid}: in baseline but missing from this run" for cid in before if cid not in now]
+    for cell in current["cells"]:
+        old = before.get(cell["id"])
+        if old is None:
+            continue
+        if old["pass"] and not cell["pass"]:
+            problems.append(f"{cell['id']}: newly failing ({', '.join(cell['failures'])})")
+            continue
+        for k, skew in cell["skew"].items():
+            if k in old["skew"] and abs(skew - old["skew"][k]) > cell["allowed"][k] + old["allowed"].get(k, 0.0):
+                problems.append(f"{cell['id']}: {k} skew moved {old['skew'][k]:+.3f} -> {skew:+.3f}")
+    return problems
+
+
+def run_parity_matrix(
+    fights: int = MATRIX_FIGHTS,
+    *,
+    workers: int | None = None,
+    engine: str = DEFAULT_ENGINE,
+    seed: int = 0,
+    dashboard: bool = False,
+) -> dict:
+    """Run every cell in parallel and return the machine-readable report."""
+    cells = matrix_cells()
+    seeds = range(seed, seed + fights)
+    job = partial(_matrix_cell, seeds=seeds, engine=engine)
+    total = sum(fights * (2 if c["kind"] == "swap" else 1) for c in cells)
+
+    def run(dash: LiveDashboard | None) -> list[dict]:
+        if workers == 1:
+            if dash:
+                dash.attach_local()
+            return [job(c) for c in cells]
+        with dash.pool(workers) if dash else ProcessPoolExecutor(workers) as pool:
+            return list(pool.map(job, cells))
+
+    if dashboard:
+        with LiveDashboard(f"QA parity matrix — {len(cells)} cells", total=total) as dash:
+            raws = run(dash)
+    else:
+        raws = run(None)
+
+    results = [evaluate_cell(c, raw) for c, raw in zip(cells, raws)]
+    return {
+        "version": REPORT_VERSION,
+        "engine": engine,
+        "fights_per_cell": fights,
+        "seed": seed,
+        "thresholds": THRESHOLDS,
+        "cells": results,
+        "summary": {"cells": len(results), "failed": [r["id"] for r in results if not r["pass"]]},
+    }
+
+
+def print_matrix(report_: dict) -> None:
+    print(f"{'Cell':<36} {'win skew':>9} {'land skew':>10} {'best skew':>10}  result")
+    print("-" * 76)
+    for c in report_["cells"]:
+        cols = [f"{c['skew'][k]:+.3f}" if k in c["skew"] else "–" for k in ("win", "land", "best")]
+        verdict = "ok" if c["pass"] else "FAIL " + ",".join(c["failures"])
+        print(f"{c['id']:<36} {cols[0]:>9} {cols[1]:>10} {cols[2]:>10}  {verdict}")
+    failed = report_["summary"]["failed"]
+    print(f"\n{report_['summary']['cells'] - len(failed)}/{report_['summary']['cells']} cells within thresholds")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Check red/blue parity for equal fighters.")
+    ap.add_argument("--fights", type=int, default=None,
+                    help=f"Number of fights (default {TEST_FIGHTS}; per cell with --matrix: {MATRIX_FIGHTS})")
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: 1, or CPU count with --matrix)")
+    ap.add_argument("--dashboard", action="store_true", help="Show a live rich dashboard")
+    ap.add_argument("--engine", choices=engine_names(), default=DEFAULT_ENGINE, help="Engine backend")
+    ap.add_argument("--matrix", action="store_true", help="Run the full parity matrix instead of one matchup")
+    ap.add_argument("--seed", type=int, default=0, help="First seed for --matrix cells")
+    ap.add_argument("--report", metavar="PATH", help="Write the --matrix report as JSON")
+    ap.add_argument("--baseline", metavar="PATH", help="Previous --matrix report to compare against")
+    args = ap.parse_args()
+
+    if not args.matrix:
+        run_parity(args.fights or TEST_FIGHTS, workers=args.workers or 1, dashboard=args.dashboard, engine=args.engine)
+        return
+
+    result = run_parity_matrix(
+        args.fights or MATRIX_FIGHTS, workers=args.workers, engine=args.engine, seed=args.seed,
+        dashboard=args.dashboard,
+    )
+    print_matrix(result)
+    problems = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            try:
+                problems = compare_reports(result, json.load(f))
+            except ValueError as exc:
+                raise SystemExit(f"FAIL: {exc}") from None
+        result["regressions"] = problems
+        for line in problems:
+            print(f"REGRESSION {line}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"Wrote report to {args.report}")
+    if result["summary"]["failed"] or problems:
+        raise SystemExit(f"FAIL: {len(result['summary']['failed'])} cell(s) over threshold, {len(problems)} regression(s)")
+
+
 if __name__ == "__main__":
-    run_parity()
+    main()
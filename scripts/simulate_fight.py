@@ -4,7 +4,8 @@ import argparse
 import json
 from typing import Dict
 
-from boxing.engine import MatchEngine, PUNCHES
+from boxing.backends import DEFAULT_ENGINE, engine_names, get_engine
+from boxing.engine import PUNCHES
 from boxing.models import Boxer
 
 DEFENCES = ("block", "dodge", "parry")
@@ -141,6 +142,7 @@ def print_defence(fight: dict):
 def main():
     ap = argparse.ArgumentParser(description="Simulate a fight and print telemetry.")
     ap.add_argument("--seed", type=int, default=42, help="Random seed")
+    ap.add_argument("--engine", choices=engine_names(), default=DEFAULT_ENGINE, help="Engine backend")
     ap.add_argument("--red-base", type=int, default=12, help="Base rating (Red)")
     ap.add_argument("--blue-base", type=int, default=12, help="Base rating (Blue)")
     ap.add_argument(
@@ -170,7 +172,11 @@ def main():
     red = make_boxer("Red", args.red_base, red_overrides)
     blue = make_boxer("Blue", args.blue_base, blue_overrides)
 
-    fight = MatchEngine(red, blue, seed=args.seed).simulate()
+    backend = get_engine(args.engine)
+    if not backend.telemetry and (args.show_rounds or args.show_breakdown or args.show_defence or args.transcript):
+        raise SystemExit(f"Engine '{args.engine}' has no telemetry; use --engine reference for tables/transcript.")
+
+    fight = backend.simulate(red, blue, args.seed)
 
     print(f"Winner: {fight['winner'] or 'Draw'}")
     print(f"Scores: {fight['scores']}")
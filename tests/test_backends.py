@@ -0,0 +1,105 @@
+"""Differential tests: every registered backend against the reference MatchEngine."""
+import math
+import random
+
+import pytest
+
+from boxing.backends import ENGINES, get_engine
+from boxing.engine import MatchEngine
+from boxing.models import RATING_FIELDS, Boxer
+
+
+def random_pairs(n: int, seed: int) -> list[tuple[Boxer, Boxer]]:
+    rng = random.Random(seed)
+
+    def boxer(name: str) -> Boxer:
+        base = rng.randint(3, 18)
+        return Boxer(name=name, **{k: max(1, min(20, base + rng.randint(-4, 4))) for k in RATING_FIELDS})
+
+    return [(boxer("Red"), boxer("Blue")) for _ in range(n)]
+
+
+EXACT = [n for n, b in ENGINES.items() if b.exact]
+INEXACT = [n for n, b in ENGINES.items() if not b.exact]
+
+
+def test_unknown_engine_lists_choices():
+    with pytest.raises(ValueError, match="reference"):
+        get_engine("warp-drive")
+
+
+@pytest.mark.parametrize("name", list(ENGINES))
+def test_result_shape(name):
+    red, blue = random_pairs(1, 0)[0]
+    out = get_engine(name).simulate(red, blue, 3)
+    assert len(out["round_points"]) == 12
+    assert out["scores"] == {
+        "Red": sum(p for p, _ in out["round_points"]),
+        "Blue": sum(p for _, p in out["round_points"]),
+    }
+    assert out["winner"] in ("Red", "Blue", None)
+
+
+@pytest.mark.parametrize("name", EXACT)
+def test_exact_backends_match_reference(name):
+    backend = get_engine(name)
+    for red, blue in random_pairs(40, 1):
+        seeds = range(10)
+        for seed, got in zip(seeds, backend.simulate_many(red, blue, seeds)):
+            ref = MatchEngine(red, blue, seed=seed).simulate()
+            assert got["winner"] == ref["winner"]
+            assert got["scores"] == ref["scores"]
+            assert got["round_points"] == get_engine("reference").simulate(red, blue, seed)["round_points"]
+
+
+@pytest.mark.parametrize("name", INEXACT)
+def test_inexact_backends_match_distribution(name):
+    """Outcome frequencies must sit within 4.5 standard errors of the reference."""
+    backend, ref = get_engine(name), get_engine("reference")
+    fights = 600
+    for red, blue in random_pairs(6, 2):
+        got = backend.simulate_many(red, blue, range(fights))
+        want = ref.simulate_many(red, blue, range(10_000, 10_000 + fights))
+        for outcome in ("Red", "Blue", None):
+            p1 = sum(f["winner"] == outcome for f in got) / fights
+            p2 = sum(f["winner"] == outcome for f in want) / fights
+            pooled = (p1 + p2) / 2
+            se = math.sqrt(max(pooled * (1 - pooled), 1 / fights) * 2 / fights)
+            assert abs(p1 - p2) <= 4.5 * se, (outcome, p1, p2)
+        m1 = sum(f["scores"]["Red"] - f["scores"]["Blue"] for f in got) / fights
+        m2 = sum(f["scores"]["Red"] - f["scores"]["Blue"] for f in want) / fights
+        assert abs(m1 - m2) < 1.0
+        if backend.telemetry:
+            for side in ("red", "blue"):
+                thrown = fights * 24
+                l1 = sum(sum(r[side]["landed"].values()) for f in got for r in f["rounds"]) / thrown
+                l2 = sum(sum(r[side]["landed"].values()) for f in want for r in f["rounds"]) / thrown
+                se = math.sqrt(max(l1 * (1 - l1), 1 / thrown) * 2 / thrown)
+                assert abs(l1 - l2) <= 4.5 * se, (side, l1, l2)
+
+
+TELEMETRY_INEXACT = [n for n in INEXACT if ENGINES[n].telemetry]
+
+
+@pytest.mark.parametrize("name", TELEMETRY_INEXACT)
+def test_defence_usage_matches_reference_on_tied_scores(name):
+    """Dodge and block tie exactly (0.15) but not as floats; labels must follow the floats."""
+    base = {k: 10 for k in RATING_FIELDS}
+    red = Boxer(name="Red", **base)
+    blue = Boxer(name="Blue", **{**base, "blocking": 3, "anticipation": 1, "agility": 3,
+                                 "reflexes": 4, "composure": 1, "decision": 18})
+    fights = 1000
+    usage = {}
+    for key, backend, seeds in (("got", get_engine(name), range(fights)),
+                                ("want", get_engine("reference"), range(10_000, 10_000 + fights))):
+        counts = dict.fromkeys(("block", "dodge", "parry"), 0)
+        for f in backend.simulate_many(red, blue, seeds):
+            for r in f["rounds"]:
+                for d, n in r["blue"]["defence"].items():
+                    counts[d] += n
+        usage[key] = counts
+    thrown = fights * 24
+    for d in ("block", "dodge", "parry"):
+        p1, p2 = usage["got"][d] / thrown, usage["want"][d] / thrown
+        se = math.sqrt(max(p1 * (1 - p1), 1 / thrown) * 2 / thrown)
+        assert abs(p1 - p2) <= 4.5 * se, (d, usage)
@@ -0,0 +1,35 @@
+import pytest
+
+from boxing.calibrate import Target, calibrate, make_engine, measure, parse_target
+from boxing.engine import MatchEngine
+from boxing.odds import land_probability
+from .test_engine import make_boxer  # reuse helper
+
+
+def test_default_coefficients_reproduce_engine():
+    red, blue = make_boxer("Red", base=14), make_boxer("Blue", base=9)
+    engine = make_engine({"ACC_WEIGHT": 1.0, "LAND_EXPONENT": 1.0})
+    assert engine(red, blue, seed=5).simulate() == MatchEngine(red, blue, seed=5).simulate()
+
+
+def test_coefficients_move_land_rate():
+    a, b = make_boxer("A", base=12), make_boxer("B", base=12)
+    weak = make_engine({"ACC_WEIGHT": 0.5})
+    assert abs(land_probability(a, b, weak) - 1 / 3) < 1e-9
+    assert measure(Target("land", 12, 0.0), {"ACC_WEIGHT": 0.5}, range(100)) < 0.40
+
+
+def test_spsa_hits_land_target():
+    target = Target("land", 12, 0.38, tolerance=0.02)
+    result = calibrate([target], fights=60, iterations=40, seed=1)
+    assert result.converged
+    assert abs(result.stats[0] - 0.38) <= 0.02
+    assert result.coeffs["ACC_WEIGHT"] < 1.0
+
+
+def test_cli_targets_are_validated():
+    assert parse_target("win", "12:4:0.65", 0.01) == Target("win", 12, 0.65, delta=4)
+    for kind, spec in (("land", "0:0.38"), ("land", "21:0.38"), ("land", "12:1.5"),
+                       ("win", "12:30:0.6"), ("win", "3:-3:0.6"), ("win", "12:4:0.6:power_x")):
+        with pytest.raises(SystemExit):
+            parse_target(kind, spec, 0.01)
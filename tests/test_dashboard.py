@@ -0,0 +1,29 @@
+from boxing.dashboard import RunStats, fight_counts, wilson_interval
+from boxing.engine import MatchEngine
+from .test_engine import make_boxer  # reuse helper
+
+
+def test_wilson_interval_brackets_estimate():
+    lo, hi = wilson_interval(480, 1000)
+    assert lo < 0.48 < hi
+    assert 0.05 < hi - lo < 0.07
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_run_stats_aggregates_worker_reports():
+    red, blue = make_boxer("Red", base=12), make_boxer("Blue", base=9)
+    stats = RunStats(total=40)
+    fights = [MatchEngine(red, blue, seed=s).simulate() for s in range(40)]
+    for i, fight in enumerate(fights):
+        stats.add(i % 2, fight_counts(fight))
+
+    assert stats.done == 40
+    assert stats.per_worker == {0: 20, 1: 20}
+    red_wins = sum(f["winner"] == "Red" for f in fights)
+    decided = sum(f["winner"] is not None for f in fights)
+    rate, lo, hi = stats.red_win_rate()
+    assert rate == red_wins / decided and lo <= rate <= hi
+    land, _, _ = stats.land_rate("red")
+    assert land == sum(
+        sum(r["red"]["landed"].values()) for f in fights for r in f["rounds"]
+    ) / (40 * 24)
@@ -0,0 +1,69 @@
+import random
+
+from boxing.engine import MatchEngine, PUNCHES
+from boxing.kernel import LAND_TABLE, SCALE, TableMatchEngine, defence_mix, defence_units, land_table, throw_plan
+from boxing.models import RATING_FIELDS, Boxer
+from boxing.odds import land_probability
+from boxing.prob import block_score, dodge_score, parry_score
+from .test_engine import make_boxer  # reuse helper
+
+
+def random_boxer(rng: random.Random, name: str) -> Boxer:
+    return Boxer(name=name, **{k: rng.randint(1, 20) for k in RATING_FIELDS})
+
+
+def test_table_matches_land_formula():
+    for s in range(2, 41):
+        for d in range(1, 241):
+            want = MatchEngine.land_chance(s / 40, d / 240)
+            assert abs(LAND_TABLE[s][d] / SCALE - want) <= 1 / SCALE
+
+
+def test_defence_units_match_float_scores():
+    rng = random.Random(4)
+    for _ in range(200):
+        b = random_boxer(rng, "X")
+        block, dodge, parry = defence_units(b)
+        assert abs(block / 240 - block_score(b)) < 1e-12
+        assert abs(dodge / 240 - dodge_score(b)) < 1e-12
+        assert abs(parry / 240 - parry_score(b)) < 1e-12
+
+
+def test_throw_plans_reproduce_land_probability():
+    """Per-throw land chance from the tables equals the closed-form engine value."""
+    rng = random.Random(5)
+    for _ in range(50):
+        att, dfn = random_boxer(rng, "A"), random_boxer(rng, "D")
+        eng = TableMatchEngine(att, dfn, seed=0)
+        table = MatchEngine._precompute_pacc(att)
+        best = max(table.values())
+        best_p = [p for p, v in table.items() if v == best]
+        focus, total = att.decision / 20, sum(table.values())
+        p_land = 0.0
+        for p in PUNCHES:
+            cum, outcomes = eng._plans[True][p]
+            landed = sum(hi - lo for lo, hi, (hit, _) in zip((0, *cum), cum, outcomes) if hit) / SCALE
+            weight = focus * (p in best_p) / len(best_p) + (1 - focus) * table[p] / total
+            p_land += weight * landed
+        assert abs(p_land - land_probability(att, dfn)) < 1e-6
+
+
+def test_plan_thresholds_cover_every_draw():
+    cum, outcomes = throw_plan(20, defence_mix(make_boxer("D", base=9)))
+    assert list(cum) == sorted(cum) and cum[-1] == SCALE
+    assert {lab for _, lab in outcomes} <= {"block", "dodge", "parry"}
+
+
+def test_table_engine_telemetry_and_seeds():
+    red, blue = make_boxer("Red", base=13), make_boxer("Blue", base=9)
+    a = TableMatchEngine(red, blue, seed=9).simulate()
+    assert a == TableMatchEngine(red, blue, seed=9).simulate()
+    assert len(a["rounds"]) == 12 and len(a["events"]) == 48
+    for rs in a["rounds"]:
+        assert sum(rs["red"]["defence"].values()) == 2
+
+
+def test_land_table_shared_by_subclasses():
+    assert land_table(TableMatchEngine) is LAND_TABLE
+    tuned = type("Tuned", (MatchEngine,), {"LAND_EXPONENT": 2.0})
+    assert land_table(tuned) is not LAND_TABLE
@@ -0,0 +1,22 @@
+from dataclasses import replace
+
+from boxing.odds import estimate_odds, land_probability, quick_odds
+from .test_engine import make_boxer  # reuse helper
+
+
+def test_quick_odds_agree_with_simulation():
+    red = replace(make_boxer("Red", base=12), accuracy=18, decision=6)
+    blue = make_boxer("Blue", base=10)
+    quick = quick_odds(red, blue)
+    sim = estimate_odds(red, blue, fights=2000, seed=0)
+
+    assert abs(sum(quick.values()) - 1.0) < 1e-9
+    for k in ("red", "blue", "draw"):
+        assert abs(quick[k] - sim[k]) < 0.04
+
+
+def test_equal_fighters_are_symmetric():
+    a, b = make_boxer("A", base=7), make_boxer("B", base=7)
+    assert abs(land_probability(a, b) - 0.5) < 1e-12
+    q = quick_odds(a, b)
+    assert abs(q["red"] - q["blue"]) < 1e-12
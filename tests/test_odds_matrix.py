@@ -0,0 +1,71 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from boxing.odds_matrix import OddsMatrix
+from .test_engine import make_boxer  # reuse helper
+
+
+def roster(n: int = 8):
+    return [make_boxer(f"F{i}", base=4 + 2 * i) for i in range(n)]
+
+
+def test_incremental_refresh_matches_full_rebuild():
+    m = OddsMatrix(roster(), fights=40)
+    assert m.refresh() == 8 * 7 // 2
+    assert m.refresh() == 0
+
+    trained = replace(roster()[3], accuracy=20, decision=20)
+    m.update(3, trained)
+    m.update(5, roster()[5])  # unchanged ratings: not dirty
+    assert m.dirty == {3}
+    assert m.refresh() == 7
+
+    fresh = OddsMatrix([trained if i == 3 else b for i, b in enumerate(roster())], fights=40)
+    assert [m.row(i) for i in range(8)] == [fresh.row(i) for i in range(8)]
+
+
+def test_parallel_matches_serial():
+    serial = OddsMatrix(roster(6), fights=20)
+    parallel = OddsMatrix(roster(6), fights=20)
+    with ProcessPoolExecutor(2) as pool:
+        parallel.refresh(pool)
+    assert [serial.row(i) for i in range(6)] == [parallel.row(i) for i in range(6)]
+
+
+def test_queries():
+    m = OddsMatrix(roster(), fights=40)
+    champ = 0  # weakest fighter by construction
+    best = m.best_against(champ, top=3)
+    column = sorted((m.win_prob(i, champ) for i in range(1, 8)), reverse=True)
+    assert [p for _, p in best] == column[:3]
+    assert m.favourites()[0][0] == 7
+    assert all(m.win_prob(i, j) + m.win_prob(j, i) <= 1.0 for i in range(8) for j in range(8) if i != j)
+    with pytest.raises(ValueError):
+        m.win_prob(2, 2)
+
+    newcomer = m.add(make_boxer("Rookie", base=20))
+    assert m.dirty == {newcomer}
+    assert m.win_prob(newcomer, 6) > 0.5
+    assert m.favourites()[0][0] == newcomer
+
+
+def test_single_update_uses_kept_pool():
+    serial = OddsMatrix(roster(6), fights=20)
+    with OddsMatrix(roster(6), fights=20, workers=2) as m:
+        m.refresh()
+        pool = m._pool
+        trained = replace(roster(6)[2], accuracy=20)
+        m.update(2, trained)
+        serial.update(2, trained)
+        assert m.refresh() == 5
+        assert m._pool is pool
+        assert [m.row(i) for i in range(6)] == [serial.row(i) for i in range(6)]
+    assert m._pool is None
+
+
+def test_fights_must_split_evenly_across_corners():
+    for fights in (0, 1, 41):
+        with pytest.raises(ValueError, match="even"):
+            OddsMatrix(roster(2), fights=fights)
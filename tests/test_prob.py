@@ -1,5 +1,13 @@
-from boxing.models import Boxer
-from boxing.prob import block_score, dodge_score, parry_score
+import random
+
+import pytest
+
+from boxing.engine import MatchEngine
+from boxing.models import PUNCHES, RATING_FIELDS, Boxer
+from boxing.prob import (
+    block_score, block_scores, dodge_score, dodge_scores, pacc_tables,
+    parry_score, parry_scores, ratings_matrix,
+)
 
 def make_boxer(base: int) -> Boxer:
     return Boxer(
@@ -16,4 +24,30 @@ def test_defence_scores_monotonic():
     low, mid, high = make_boxer(5), make_boxer(10), make_boxer(15)
     assert block_score(low)  < block_score(mid)  < block_score(high)
     assert dodge_score(low)  < dodge_score(mid)  < dodge_score(high)
-    assert parry_score(low)  < parry_score(mid)  < parry_score(high)
\ No newline at end of file
+    assert parry_score(low)  < parry_score(mid)  < parry_score(high)
+
+def test_batch_scores_match_scalar():
+    """Property: batch formulas equal the scalar ones on random rosters."""
+    rng = random.Random(2026)
+    for _ in range(50):
+        boxers = [
+            Boxer(**{k: rng.randint(1, 20) for k in RATING_FIELDS})
+            for _ in range(rng.randint(0, 40))
+        ]
+        m = ratings_matrix(boxers)
+        assert block_scores(m) == [block_score(b) for b in boxers]
+        assert dodge_scores(m) == [dodge_score(b) for b in boxers]
+        assert parry_scores(m) == [parry_score(b) for b in boxers]
+        assert block_scores(m) == [b.block_score() for b in boxers]
+        assert dodge_scores(m) == [b.dodge_score() for b in boxers]
+        assert parry_scores(m) == [b.parry_score() for b in boxers]
+        assert pacc_tables(m) == [
+            tuple(MatchEngine._precompute_pacc(b)[p] for p in PUNCHES) for b in boxers
+        ]
+
+def test_batch_rejects_bad_rows():
+    row = [10] * len(RATING_FIELDS)
+    for m in ([row[:-1]], [row, row[:-1]], [row + [10]]):
+        for fn in (block_scores, dodge_scores, parry_scores, pacc_tables):
+            with pytest.raises(ValueError):
+                fn(m)
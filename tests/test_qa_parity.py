@@ -0,0 +1,37 @@
+import pytest
+
+from scripts.qa_parity import _matrix_cell, compare_reports, evaluate_cell, matrix_cells
+
+
+def test_matrix_catalogue_covers_every_base():
+    ids = [c["id"] for c in matrix_cells()]
+    assert [i for i in ids if i.startswith("base/")] == [f"base/{b:02d}" for b in range(1, 21)]
+    assert any(i.startswith("swap/") for i in ids)
+    assert len(ids) == len(set(ids))
+
+
+def test_cell_report_and_baseline_compare():
+    cells = {c["id"]: c for c in matrix_cells()}
+    seeds = range(200)
+    mirror = evaluate_cell(cells["base/03"], _matrix_cell(cells["base/03"], seeds, "reference"))
+    swap_id = next(i for i in cells if i.startswith("swap/"))
+    swap = evaluate_cell(cells[swap_id], _matrix_cell(cells[swap_id], seeds, "outcome"))
+
+    assert set(mirror["skew"]) == {"win", "land", "best"}
+    assert set(swap["skew"]) == {"win"}  # outcome-only engine: no telemetry
+    assert mirror["pass"] and swap["pass"]
+
+    header = {"engine": "reference", "fights_per_cell": 200, "seed": 0}
+    report = {**header, "cells": [mirror, swap]}
+    assert compare_reports(report, report) == []
+    drifted = {**header, "cells": [dict(mirror, skew={**mirror["skew"], "win": mirror["skew"]["win"] + 0.5}), swap]}
+    assert compare_reports(drifted, report) == [
+        f"base/03: win skew moved {mirror['skew']['win']:+.3f} -> {mirror['skew']['win'] + 0.5:+.3f}"
+    ]
+    assert compare_reports({**header, "cells": [mirror]}, report) == [
+        f"{swap_id}: in baseline but missing from this run"
+    ]
+    with pytest.raises(ValueError, match="engine 'fast' vs 'reference'"):
+        compare_reports(report, {**report, "engine": "fast"})
+    with pytest.raises(ValueError, match="fights_per_cell"):
+        compare_reports(report, {**report, "fights_per_cell": 1000})
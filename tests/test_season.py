@@ -0,0 +1,105 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from boxing.models import RATING_FIELDS, Boxer
+from boxing.season import Season
+
+
+def make_roster(n: int, seed: int = 0) -> list[Boxer]:
+    rng = random.Random(seed)
+    return [Boxer(name=f"F{i}", **{k: rng.randint(1, 20) for k in RATING_FIELDS}) for i in range(n)]
+
+
+def test_records_track_bouts():
+    season = Season(make_roster(41), seed=3, bouts_per_card=4)
+    season.run(3, workers=1)
+
+    assert season.week == 3
+    bouts = season.bouts
+    assert len(bouts) == 3 * 20  # 41 fighters -> 20 pairs a week
+    for fid in range(len(season)):
+        w, l, d = season.record(fid)
+        assert w + l + d == sum(fid in (b.red, b.blue) for b in bouts)
+    total = [sum(col) for col in zip(*(season.record(f) for f in range(len(season))))]
+    assert total[0] == total[1]  # every win is someone's loss
+
+
+def test_parallel_matches_serial():
+    serial = Season(make_roster(30), seed=7)
+    serial.run(2, workers=1)
+    parallel = Season(make_roster(30), seed=7)
+    with ProcessPoolExecutor(2) as pool:
+        for _ in range(2):
+            parallel.simulate_week(pool)
+    assert serial.bouts == parallel.bouts
+
+
+def test_snapshot_roundtrip(tmp_path):
+    season = Season(make_roster(25), seed=1, active_share=0.8)
+    season.run(2, workers=1)
+    path = tmp_path / "career.mems"
+    season.save(path)
+
+    loaded = Season.load(path)
+    assert loaded.week == season.week
+    assert loaded.bouts == season.bouts
+    assert [loaded.record(f) for f in range(25)] == [season.record(f) for f in range(25)]
+    assert loaded.fighter(4) == season.fighter(4)
+
+    # both continue identically
+    season.simulate_week()
+    loaded.simulate_week()
+    assert loaded.bouts == season.bouts
+
+
+def test_snapshot_layout_is_fixed_width(tmp_path):
+    season = Season(make_roster(9), seed=2)
+    season.run(2, workers=1)
+    path = tmp_path / "career.mems"
+    season.save(path)
+    names = sum(len(season.fighter(f).name) for f in range(9)) + 8  # NUL separators
+    header = 4 + 2 + 4 + 4 + 4 + 8 + 4 + 8
+    assert path.stat().st_size == header + 9 * 22 + 9 * 3 * 4 + len(season.bouts) * 4 * 4 + 4 + names
+
+
+def test_snapshot_rejects_garbage(tmp_path):
+    path = tmp_path / "bad.mems"
+    path.write_bytes(b"nope" + bytes(64))
+    with pytest.raises(ValueError):
+        Season.load(path)
+
+
+def test_snapshot_truncated_anywhere(tmp_path):
+    season = Season(make_roster(5))
+    season.run(1, workers=1)
+    path = tmp_path / "career.mems"
+    season.save(path)
+    data = path.read_bytes()
+    for cut in range(len(data)):
+        path.write_bytes(data[:cut])
+        with pytest.raises(ValueError, match="truncated"):
+            Season.load(path)
+
+
+def test_names_with_nul_rejected():
+    season = Season(make_roster(2))
+    bad = replace(make_roster(1)[0], name="Bad\0Name")
+    with pytest.raises(ValueError, match="NUL"):
+        season.add_fighter(bad)
+    with pytest.raises(ValueError, match="NUL"):
+        season.replace_fighter(0, bad)
+    assert len(season) == 2
+
+
+def test_large_roster_loads_fast(tmp_path):
+    season = Season(make_roster(20_000))
+    path = tmp_path / "big.mems"
+    season.save(path)
+    t0 = time.perf_counter()
+    loaded = Season.load(path)
+    assert time.perf_counter() - t0 < 5.0  # bulk copies, not 20k Boxer builds; loose for busy CI
+    assert len(loaded) == 20_000
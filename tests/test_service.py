@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+from boxing import service as service_mod
+from boxing.engine import MatchEngine
+from boxing.service import ServiceError, SimulationClient, SimulationService, run_batch
+from .test_engine import make_boxer  # reuse helper
+
+
+async def _exercise():
+    red, blue = make_boxer("Red", base=12), make_boxer("Blue", base=10)
+    async with SimulationService(workers=1, window=0.01) as service:
+        await service.start("127.0.0.1", 0)
+        host, port = service.address[:2]
+        async with await SimulationClient.connect(host, port) as client:
+            fights = await asyncio.gather(*(client.fight(red, blue, seed=s) for s in range(20)))
+            odds = await client.odds(red, blue, fights=20, seed=0)
+            try:
+                await client.request("fight", red=[10] * 3, blue=blue.ratings())
+                bad = None
+            except ServiceError as exc:
+                bad = exc
+            stats = await client.stats()
+    return fights, odds, bad, stats
+
+
+def test_service_batches_and_matches_engine():
+    fights, odds, bad, stats = asyncio.run(_exercise())
+    red, blue = make_boxer("Red", base=12), make_boxer("Blue", base=10)
+
+    for seed, got in enumerate(fights):
+        ref = MatchEngine(red, blue, seed=seed).simulate()
+        assert got["scores"] == {"red": ref["scores"]["Red"], "blue": ref["scores"]["Blue"]}
+        assert got["winner"] == (ref["winner"].lower() if ref["winner"] else None)
+
+    assert abs(sum(odds.values()) - 1.0) < 1e-9
+    assert bad is not None
+    assert stats["requests"] == 22 and stats["errors"] == 1
+    assert stats["batches"] < 22  # concurrent fights were grouped
+
+
+async def _raw_lines(lines: list[bytes]) -> list[dict]:
+    async with SimulationService(workers=1, window=0.01) as service:
+        await service.start("127.0.0.1", 0)
+        host, port = service.address[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b"".join(lines))
+        await writer.drain()
+        replies = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in lines]
+        writer.close()
+        await writer.wait_closed()
+    return replies
+
+
+def test_service_rejects_non_object_requests():
+    replies = asyncio.run(_raw_lines([b"[1, 2]\n", b"5\n", b"{not json\n"]))
+    assert all(r["id"] is None and "error" in r for r in replies)
+    assert "JSON object" in replies[0]["error"]
+
+
+def test_batches_are_split_across_workers():
+    async def run():
+        async with SimulationService(workers=3, window=0.05) as service:
+            await service.start("127.0.0.1", 0)
+            calls = []
+            real = service._run_chunk
+
+            async def spy(chunk):
+                calls.append(len(chunk))
+                await real(chunk)
+
+            service._run_chunk = spy
+            red = make_boxer("Red", base=12).ratings()
+            jobs = [{"op": "fight", "red": red, "blue": red, "seed": s} for s in range(10)]
+            await asyncio.gather(*(service.submit(j) for j in jobs))
+        return calls
+
+    assert asyncio.run(run()) == [4, 4, 2]
+
+
+def test_bad_job_does_not_stall_its_batch():
+    async def run():
+        async with SimulationService(workers=1, window=0.05) as service:
+            await service.start("127.0.0.1", 0)
+            good = make_boxer("Red", base=12).ratings()
+            floats = [0.0] * 21 + [20.0]
+            jobs = [
+                {"op": "fight", "red": good, "blue": good, "seed": 1},
+                {"op": "fight", "red": floats, "blue": floats, "seed": 2},
+                {"op": "odds", "red": good, "blue": good, "fights": 10**12},
+                {"op": "fight", "red": good, "blue": good, "seed": 3},
+            ]
+            return await asyncio.wait_for(
+                asyncio.gather(*(service.submit(j) for j in jobs), return_exceptions=True), 5
+            )
+
+    ok1, floats, huge, ok2 = asyncio.run(run())
+    assert "winner" in ok1 and "winner" in ok2
+    assert isinstance(floats, ServiceError) and "integers" in str(floats)
+    assert isinstance(huge, ServiceError) and "fights" in str(huge)
+
+
+def test_close_with_connected_client_and_queued_requests():
+    async def run():
+        service = SimulationService(workers=1, window=10)  # batch never dispatches on its own
+        await service.start("127.0.0.1", 0)
+        host, port = service.address[:2]
+        client = await SimulationClient.connect(host, port)
+        red = make_boxer("Red", base=12)
+        pending = asyncio.ensure_future(client.fight(red, red, seed=0))
+        await asyncio.sleep(0.1)
+        await asyncio.wait_for(service.close(), 5)
+        try:
+            await asyncio.wait_for(pending, 5)
+        except ServiceError as exc:
+            return exc
+        finally:
+            await client.close()
+
+    assert isinstance(asyncio.run(run()), ServiceError)
+
+
+def test_run_batch_reports_unexpected_errors(monkeypatch):
+    def boom(job):
+        if job["seed"]:
+            raise ZeroDivisionError("float division by zero")
+        return {"ok": True}
+
+    monkeypatch.setattr(service_mod, "_run_job", boom)
+    assert run_batch([{"seed": 0}, {"seed": 1}]) == [
+        (True, {"ok": True}), (False, "ZeroDivisionError: float division by zero")
+    ]